@@ -5,16 +5,260 @@ Extracts document metadata and formatting information from PDFs
 for validation against LCvR requirements.
 """
 
+import hashlib
+import json
+import os
 import re
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional
 
 # Note: Requires these dependencies:
 # pip install PyPDF2 pdfplumber pymupdf
 
+# PDF backends are resolved once at import. PyMuPDF is the most
+# comprehensive, pdfplumber has good text extraction, PyPDF2 is the fallback.
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+
+if fitz is not None:
+    PDF_BACKEND = "pymupdf"
+elif pdfplumber is not None:
+    PDF_BACKEND = "pdfplumber"
+elif PdfReader is not None:
+    PDF_BACKEND = "pypdf2"
+else:
+    PDF_BACKEND = None
+
+# Optional: google-re2 gives linear-time matching over full document text
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+def _compile(pattern: str):
+    """Compile with RE2 when available, falling back to the stdlib engine."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Case number pattern
+CASE_NUMBER_PATTERN = r"1:\d{2}-cv-\d{5}-[A-Z]{2,4}"
+
+# Common document title patterns
+TITLE_PATTERNS = [
+    r"MOTION\s+TO\s+\w+",
+    r"MEMORANDUM\s+IN\s+(?:SUPPORT|OPPOSITION)",
+    r"REPLY\s+(?:MEMORANDUM|IN\s+SUPPORT)",
+    r"COMPLAINT",
+    r"ANSWER",
+    r"NOTICE\s+OF\s+APPEAL",
+    r"BRIEF\s+(?:OF|IN\s+SUPPORT)",
+]
+
+# Compiled once at import; every analyzer instance shares these
+_CASE_NUMBER_RE = _compile(CASE_NUMBER_PATTERN)
+_TITLE_RES = [re.compile(p, re.IGNORECASE) for p in TITLE_PATTERNS]
+# The gap between "District Court" and "District of Columbia" is bounded so a
+# lone "District Court" can't trigger a scan to the end of the document, and
+# may span a line break as it does in most captions
+_COURT_PATTERN = r"(?i:DISTRICT\s+COURT(?s:.{0,200}?)DISTRICT\s+OF\s+COLUMBIA|D\.D\.C\.|DDC)"
+_COURT_RE = _compile(_COURT_PATTERN)
+
+# Federal Reporter, US Reports, Supreme Court Reporter
+_CITATION_PATTERN = (
+    r"\d+\s+F\.(?:2d|3d|4th)?\s+\d+"
+    r"|\d+\s+U\.S\.\s+\d+"
+    r"|\d+\s+S\.?\s*Ct\.?\s+\d+"
+)
+_CITATION_RE = _compile(_CITATION_PATTERN)
+
+# Signature block elements; bar number and DC address are case-insensitive
+_SIG_PATTERNS = {
+    "attorney_name": r"/s/\s+\w+",
+    "dc_bar_number": r"(?i:(?:DC|D\.C\.)\s*Bar\s*(?:No\.?|#)?\s*)\d+",
+    "email": r"[\w\.-]+@[\w\.-]+\.\w+",
+    "telephone": r"\(\d{3}\)\s*\d{3}[-.\s]?\d{4}",
+    "address": r"(?i:Washington,?\s*D\.?C\.?\s*\d{5})",
+}
+_BAR_NO_RE = re.compile(r"\d+$")
+
+# Signature block elements, citations and the court name, fused into a
+# single alternation so one pass over the document text finds all of them
+_TEXT_SCAN_RE = _compile(
+    "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in _SIG_PATTERNS.items())
+    + rf"|(?P<citation>{_CITATION_PATTERN})"
+    + rf"|(?P<court_name>{_COURT_PATTERN})"
+)
+
+# Optional: Hyperscan matches every pattern in one SIMD pass over the text
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+def _build_hyperscan_db():
+    """Compile the text scan patterns into a Hyperscan database, or None."""
+    if hyperscan is None:
+        return None
 
-@dataclass
+    # Same order as the _TEXT_SCAN_RE alternation. Start offsets are needed
+    # to rebuild finditer's non-overlapping matches; the court name only
+    # needs to be seen once (and its bounded gap is too large for SOM).
+    kinds = [*_SIG_PATTERNS, "citation", "court_name"]
+    patterns = [*_SIG_PATTERNS.values(), _CITATION_PATTERN, _COURT_PATTERN]
+    flags = [hyperscan.HS_FLAG_SOM_LEFTMOST] * (len(kinds) - 1) + [hyperscan.HS_FLAG_SINGLEMATCH]
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[pattern.encode() for pattern in patterns],
+            ids=list(range(len(kinds))),
+            elements=len(kinds),
+            flags=flags,
+        )
+    except hyperscan.error:
+        return None
+    return db, kinds
+
+
+_HYPERSCAN = _build_hyperscan_db()
+
+# Standalone 1..4 for the text-only page number heuristic
+_PAGE_NUMBER_RES = {i: re.compile(rf"\b{i}\b") for i in range(1, 5)}
+
+# Fonts that never carry body text
+_SYMBOL_FONTS = ("symbol", "zapf", "wingding")
+
+_SIG_FIELDS = tuple(_SIG_PATTERNS)
+MAX_CITATIONS = 20
+
+# Analysis results are cached here, keyed by PDF content hash. Entries hold
+# the full extracted text, so only the most recently used CACHE_MAX_ENTRIES
+# (and at most CACHE_MAX_BYTES) are kept.
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "dc-drafter"
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Bump when extraction logic changes; entries from other versions are deleted
+CACHE_VERSION = 3
+
+# Below this many pages, process startup costs more than it saves (most
+# pages only need plain text extraction, which is cheap)
+PARALLEL_MIN_PAGES = 200
+
+# Body font and size settle within the first few pages, so only those get
+# the (expensive) per-span font inventory
+FONT_SAMPLE_PAGES = 3
+
+
+def _extract_pymupdf_pages(
+    doc, start: int, stop: int, extract_fonts: bool = True
+) -> list[tuple[str, Counter, Counter]]:
+    """
+    Extract (text, fonts, font_sizes) for pages start..stop-1 of an open fitz document.
+
+    Fonts and sizes are counted by characters of text set in them, so the
+    body text font outweighs headings and cover-page display fonts. Only
+    the first FONT_SAMPLE_PAGES pages get the (much slower) "dict" pass;
+    later pages, and every page with extract_fonts=False, get plain text
+    and empty counters.
+    """
+    pages = []
+    for page_num in range(start, stop):
+        page = doc.load_page(page_num)
+        fonts = Counter()
+        font_sizes = Counter()
+
+        if not extract_fonts or page_num >= FONT_SAMPLE_PAGES:
+            pages.append((page.get_text("text"), fonts, font_sizes))
+            page = None
+            continue
+
+        # Build MuPDF's text page once and share it between both extractions
+        textpage = page.get_textpage()
+        text = page.get_text("text", textpage=textpage)
+
+        # Get font info from text blocks
+        blocks = page.get_text("dict", textpage=textpage)["blocks"]
+        for block in blocks:
+            if "lines" in block:
+                for line in block["lines"]:
+                    for span in line["spans"]:
+                        weight = len(span.get("text", "")) or 1
+                        fonts[span.get("font", "Unknown")] += weight
+                        font_sizes[round(span.get("size", 0), 1)] += weight
+
+        pages.append((text, fonts, font_sizes))
+
+        # Release MuPDF's per-page memory before loading the next page
+        textpage = None
+        page = None
+    return pages
+
+
+def _pymupdf_page_worker(args: tuple[str, int, int, bool]) -> list[tuple[str, Counter, Counter]]:
+    """Process pool entry point; fitz documents can't cross processes, so reopen here."""
+    pdf_path, start, stop, extract_fonts = args
+    doc = fitz.open(pdf_path)
+    try:
+        return _extract_pymupdf_pages(doc, start, stop, extract_fonts)
+    finally:
+        doc.close()
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """
+    Delete cache entries from other CACHE_VERSIONs, then the least recently
+    used ones beyond CACHE_MAX_ENTRIES or CACHE_MAX_BYTES.
+    """
+    prefix = f"v{CACHE_VERSION}-"
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".json"):
+                continue
+            # Other processes may prune the same directory concurrently
+            try:
+                if not entry.name.startswith(prefix):
+                    os.remove(entry.path)
+                    continue
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+
+    # Newest first; always keep the newest (the entry just written)
+    entries.sort(reverse=True)
+    total = 0
+    for i, (_, size, path) in enumerate(entries):
+        total += size
+        if i and (i >= CACHE_MAX_ENTRIES or total > CACHE_MAX_BYTES):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+@dataclass(slots=True, frozen=True)
 class DocumentMetadata:
     """Extracted document metadata."""
     page_count: int
@@ -27,97 +271,177 @@ class DocumentMetadata:
     case_number: Optional[str]
     document_title: Optional[str]
     margins: Optional[dict]
-    text_content: str
+    text_content: str = field(repr=False)  # Can be megabytes; keep it out of logs
 
 
 class PDFAnalyzer:
     """Analyzes PDFs for DC court compliance checking."""
 
-    # Case number pattern
-    CASE_NUMBER_PATTERN = r"1:\d{2}-cv-\d{5}-[A-Z]{2,4}"
-
-    # Common document title patterns
-    TITLE_PATTERNS = [
-        r"MOTION\s+TO\s+\w+",
-        r"MEMORANDUM\s+IN\s+(?:SUPPORT|OPPOSITION)",
-        r"REPLY\s+(?:MEMORANDUM|IN\s+SUPPORT)",
-        r"COMPLAINT",
-        r"ANSWER",
-        r"NOTICE\s+OF\s+APPEAL",
-        r"BRIEF\s+(?:OF|IN\s+SUPPORT)",
-    ]
-
-    def __init__(self, pdf_path: str):
+    CASE_NUMBER_PATTERN = CASE_NUMBER_PATTERN
+    TITLE_PATTERNS = TITLE_PATTERNS
+
+    # "pymupdf", "pdfplumber" or "pypdf2"; override per class or instance
+    backend = PDF_BACKEND
+
+    def __init__(
+        self,
+        pdf_path: str,
+        num_workers: Optional[int] = None,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        extract_fonts: bool = True,
+    ):
         self.pdf_path = Path(pdf_path)
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    def analyze(self) -> DocumentMetadata:
+        # Worker processes for PyMuPDF page extraction on long documents
+        self.num_workers = num_workers or min(os.cpu_count() or 1, 4)
+
+        # Set cache_dir=None to disable the on-disk result cache
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._cached: Optional[DocumentMetadata] = None
+
+        # Font inventory is the most expensive part of extraction; callers
+        # that only need text-derived fields can turn it off
+        self.extract_fonts = extract_fonts
+
+        # Open PyMuPDF document, kept until close() so later page queries
+        # don't re-parse the file
+        self._doc = None
+
+    def __enter__(self) -> "PDFAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying PDF document, if one is open."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+
+    def _open_doc(self):
+        """Return the open PyMuPDF document, opening it on first use."""
+        if self._doc is None:
+            self._doc = fitz.open(str(self.pdf_path))
+        return self._doc
+
+    @classmethod
+    def quick_validate(cls, pdf_path: str) -> dict:
+        """
+        Validation dict without font detection.
+
+        Font and font size come back as None, so the font checks report
+        them as undetected.
+        """
+        with cls(pdf_path, extract_fonts=False) as analyzer:
+            return analyzer.to_validation_dict()
+
+    def analyze(self, force_refresh: bool = False) -> DocumentMetadata:
         """
         Analyze PDF and extract metadata.
 
+        Results are memoized on the instance and cached on disk by content
+        hash; pass force_refresh=True to re-parse the PDF.
+
         Returns DocumentMetadata with all extracted information.
         """
-        try:
-            import fitz  # PyMuPDF
-            return self._analyze_with_pymupdf()
-        except ImportError:
+        if self._cached is not None and not force_refresh:
+            return self._cached
+
+        cache_file = self._cache_file()
+        if cache_file and not force_refresh:
             try:
-                import pdfplumber
-                return self._analyze_with_pdfplumber()
-            except ImportError:
-                from PyPDF2 import PdfReader
-                return self._analyze_with_pypdf2()
+                self._cached = DocumentMetadata(**json.loads(cache_file.read_text(encoding="utf-8")))
+                os.utime(cache_file)  # Mark as recently used
+                return self._cached
+            except (OSError, ValueError, TypeError):
+                pass  # Missing or stale cache entry; re-analyze
+
+        self._cached = self._run_backend()
+
+        if cache_file:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(asdict(self._cached)), encoding="utf-8")
+                _prune_cache(cache_file.parent)
+            except OSError:
+                pass  # Caching is best-effort
+
+        return self._cached
+
+    def _cache_file(self) -> Optional[Path]:
+        """Path of the on-disk cache entry for this PDF's contents."""
+        if self.cache_dir is None:
+            return None
+
+        key = f"v{CACHE_VERSION}:{self.backend}:fonts={int(self.extract_fonts)}"
+        digest = hashlib.blake2b(key.encode(), digest_size=16)
+        with open(self.pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return self.cache_dir / f"v{CACHE_VERSION}-{digest.hexdigest()}.json"
+
+    def _run_backend(self) -> DocumentMetadata:
+        """Analyze with the PDF library selected by `backend`."""
+        if self.backend is None:
+            raise ImportError("No PDF library installed. Run: pip install pymupdf")
+        return getattr(self, f"_analyze_with_{self.backend}")()
 
     def _analyze_with_pymupdf(self) -> DocumentMetadata:
         """Analyze using PyMuPDF (most comprehensive)."""
-        import fitz
-
-        doc = fitz.open(str(self.pdf_path))
+        doc = self._open_doc()
 
         # Basic info
         page_count = len(doc)
 
-        # Extract text and check if searchable
-        full_text = ""
-        fonts = set()
-        font_sizes = set()
+        # Extract text and font info, splitting long documents across processes
+        if self.num_workers > 1 and page_count >= PARALLEL_MIN_PAGES:
+            chunk = -(-page_count // self.num_workers)
+            ranges = [
+                (str(self.pdf_path), start, min(start + chunk, page_count), self.extract_fonts)
+                for start in range(0, page_count, chunk)
+            ]
+            with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+                pages = [page for part in executor.map(_pymupdf_page_worker, ranges) for page in part]
+        else:
+            pages = _extract_pymupdf_pages(doc, 0, page_count, self.extract_fonts)
+
+        page_texts = []
+        fonts = Counter()
+        font_sizes = Counter()
         has_page_numbers = False
+        case_number = None
 
-        for page_num, page in enumerate(doc):
-            text = page.get_text()
-            full_text += text + "\n"
+        for page_num, (text, page_fonts, page_font_sizes) in enumerate(pages):
+            page_texts.append(text)
+            fonts.update(page_fonts)
+            font_sizes.update(page_font_sizes)
 
-            # Get font info from text blocks
-            blocks = page.get_text("dict")["blocks"]
-            for block in blocks:
-                if "lines" in block:
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            fonts.add(span.get("font", "Unknown"))
-                            font_sizes.add(span.get("size", 0))
+            # Case number is on the caption page; stop looking once found
+            if case_number is None:
+                case_number = self._extract_case_number(text)
 
             # Check for page numbers (look for standalone numbers at page edges)
             if self._detect_page_number(text, page_num + 1):
                 has_page_numbers = True
 
-        doc.close()
+        full_text = "\n".join(page_texts)
 
         # Determine primary font and size
-        fonts_list = list(fonts)
-        font_sizes_list = sorted(list(font_sizes), reverse=True)
+        # Most-used font and size are the body text's
+        fonts_list = [font for font, _ in fonts.most_common()]
+        font_sizes_list = sorted(font_sizes, reverse=True)
 
         primary_font = self._get_primary_font(fonts_list)
-        primary_font_size = font_sizes_list[0] if font_sizes_list else None
+        primary_font_size = font_sizes.most_common(1)[0][0] if font_sizes else None
 
         # Check if searchable
         is_searchable = len(full_text.strip()) > 100
 
-        # Extract case number
-        case_number = self._extract_case_number(full_text)
-
-        # Extract document title
-        document_title = self._extract_document_title(full_text)
+        # Extract document title from the first page
+        document_title = self._extract_document_title(page_texts[0] if page_texts else "")
 
         return DocumentMetadata(
             page_count=page_count,
@@ -135,26 +459,29 @@ class PDFAnalyzer:
 
     def _analyze_with_pdfplumber(self) -> DocumentMetadata:
         """Analyze using pdfplumber (good text extraction)."""
-        import pdfplumber
-
-        full_text = ""
-        fonts = set()
-        font_sizes = set()
+        page_texts = []
+        fonts = Counter()
+        font_sizes = Counter()
+        case_number = None
 
         with pdfplumber.open(str(self.pdf_path)) as pdf:
             page_count = len(pdf.pages)
 
-            for page in pdf.pages:
+            for page_number, page in enumerate(pdf.pages):
                 text = page.extract_text() or ""
-                full_text += text + "\n"
+                page_texts.append(text)
+                if case_number is None:
+                    case_number = self._extract_case_number(text)
 
-                # Extract font info from chars
-                for char in page.chars:
-                    fonts.add(char.get("fontname", "Unknown"))
-                    font_sizes.add(char.get("size", 0))
+                # Extract font info from chars on the sampled pages
+                if self.extract_fonts and page_number < FONT_SAMPLE_PAGES:
+                    for char in page.chars:
+                        fonts[char.get("fontname", "Unknown")] += 1
+                        font_sizes[round(char.get("size", 0), 1)] += 1
 
-        fonts_list = list(fonts)
-        font_sizes_list = sorted(list(font_sizes), reverse=True)
+        full_text = "\n".join(page_texts)
+        fonts_list = [font for font, _ in fonts.most_common()]
+        font_sizes_list = sorted(font_sizes, reverse=True)
 
         return DocumentMetadata(
             page_count=page_count,
@@ -162,25 +489,28 @@ class PDFAnalyzer:
             fonts=fonts_list,
             primary_font=self._get_primary_font(fonts_list),
             font_sizes=font_sizes_list,
-            primary_font_size=font_sizes_list[0] if font_sizes_list else None,
+            primary_font_size=font_sizes.most_common(1)[0][0] if font_sizes else None,
             has_page_numbers=self._detect_page_numbers_in_text(full_text, page_count),
-            case_number=self._extract_case_number(full_text),
-            document_title=self._extract_document_title(full_text),
+            case_number=case_number,
+            document_title=self._extract_document_title(page_texts[0] if page_texts else ""),
             margins=None,
             text_content=full_text
         )
 
     def _analyze_with_pypdf2(self) -> DocumentMetadata:
         """Analyze using PyPDF2 (basic, fallback)."""
-        from PyPDF2 import PdfReader
-
         reader = PdfReader(str(self.pdf_path))
         page_count = len(reader.pages)
 
-        full_text = ""
+        page_texts = []
+        case_number = None
         for page in reader.pages:
             text = page.extract_text() or ""
-            full_text += text + "\n"
+            page_texts.append(text)
+            if case_number is None:
+                case_number = self._extract_case_number(text)
+
+        full_text = "\n".join(page_texts)
 
         return DocumentMetadata(
             page_count=page_count,
@@ -190,40 +520,39 @@ class PDFAnalyzer:
             font_sizes=[],
             primary_font_size=None,
             has_page_numbers=self._detect_page_numbers_in_text(full_text, page_count),
-            case_number=self._extract_case_number(full_text),
-            document_title=self._extract_document_title(full_text),
+            case_number=case_number,
+            document_title=self._extract_document_title(page_texts[0] if page_texts else ""),
             margins=None,
             text_content=full_text
         )
 
     def _get_primary_font(self, fonts: list[str]) -> Optional[str]:
-        """Determine the primary font (likely body text font)."""
-        # Look for Times New Roman variants
-        for font in fonts:
-            if "times" in font.lower():
-                return "Times New Roman"
-
-        # Return first non-symbol font
+        """Determine the primary font (likely body text font) from fonts ordered by usage."""
+        # Most-used non-symbol font, normalizing Times New Roman variants
         for font in fonts:
-            if not any(x in font.lower() for x in ["symbol", "zapf", "wingding"]):
-                return font
+            font_lower = font.lower()
+            if any(x in font_lower for x in _SYMBOL_FONTS):
+                continue
+            return "Times New Roman" if "times" in font_lower else font
 
         return fonts[0] if fonts else None
 
     def _extract_case_number(self, text: str) -> Optional[str]:
         """Extract case number from document text."""
-        match = re.search(self.CASE_NUMBER_PATTERN, text)
+        # The pattern's literal "1:" prefix already lets the engine skip
+        # ahead at C speed; anchoring on "-cv-" with str.find measured slower
+        match = _CASE_NUMBER_RE.search(text)
         return match.group(0) if match else None
 
     def _extract_document_title(self, text: str) -> Optional[str]:
         """Extract document title from first page."""
         # Look in first 2000 chars (first page area)
-        first_page = text[:2000].upper()
+        first_page = text[:2000]
 
-        for pattern in self.TITLE_PATTERNS:
-            match = re.search(pattern, first_page)
+        for pattern in _TITLE_RES:
+            match = pattern.search(first_page)
             if match:
-                return match.group(0)
+                return match.group(0).upper()
 
         return None
 
@@ -234,30 +563,32 @@ class PDFAnalyzer:
         if not lines:
             return False
 
-        # Check last few lines for page number
+        # Check last few lines for page number ("5" or "Page 5")
+        expected = str(expected_num)
         for line in lines[-3:]:
             line = line.strip()
             if line.isdigit() and int(line) == expected_num:
                 return True
-            if re.match(rf"^{expected_num}$", line):
-                return True
-            if re.match(rf"^Page\s+{expected_num}$", line, re.IGNORECASE):
+            label = line[4:]
+            if (line[:4].lower() == "page" and label[:1].isspace()
+                    and label.lstrip() == expected):
                 return True
 
         return False
 
     def _detect_page_numbers_in_text(self, text: str, page_count: int) -> bool:
         """Heuristic check for page numbers in document."""
-        # Look for sequential numbers that could be page numbers
+        # Look for sequential numbers that could be page numbers; a plain
+        # substring test rules out most misses before the word-boundary check
         for i in range(1, min(page_count + 1, 5)):
-            if re.search(rf"\b{i}\b", text):
-                continue
-            return False
+            if str(i) not in text or not _PAGE_NUMBER_RES[i].search(text):
+                return False
         return True
 
     def to_validation_dict(self) -> dict:
         """Convert metadata to format expected by DCCourtFormatChecker."""
         metadata = self.analyze()
+        scan = self._scan_text_content(metadata.text_content)
 
         # Map font names to standard names
         font = metadata.primary_font
@@ -273,16 +604,16 @@ class PDFAnalyzer:
             "document_type": self._infer_document_type(metadata.document_title),
             "case_number": metadata.case_number,
             "caption": {
-                "court_name": self._has_court_name(metadata.text_content),
+                "court_name": scan["court_name"],
                 "plaintiff": True,  # Would need NER to extract
                 "defendant": True,
                 "case_number": metadata.case_number,
                 "document_title": metadata.document_title
             } if metadata.case_number else None,
-            "signature_block": self._detect_signature_block(metadata.text_content),
+            "signature_block": scan["sig_block"],
             "is_searchable": metadata.is_searchable,
             "has_page_numbers": metadata.has_page_numbers,
-            "citations": self._extract_citations(metadata.text_content)
+            "citations": scan["citations"]
         }
 
     def _infer_document_type(self, title: Optional[str]) -> str:
@@ -299,60 +630,106 @@ class PDFAnalyzer:
 
     def _has_court_name(self, text: str) -> bool:
         """Check if document has DC court name."""
-        patterns = [
-            r"DISTRICT\s+COURT.*DISTRICT\s+OF\s+COLUMBIA",
-            r"D\.D\.C\.",
-            r"DDC"
-        ]
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return bool(_COURT_RE.search(text))
 
     def _detect_signature_block(self, text: str) -> Optional[dict]:
         """Detect signature block elements."""
-        sig_block = {}
-
-        # Look for /s/ signature
-        if re.search(r"/s/\s+\w+", text):
-            sig_block["attorney_name"] = True
+        return self._scan_text_content(text)["sig_block"]
 
-        # Look for DC Bar number
-        bar_match = re.search(r"(?:DC|D\.C\.)\s*Bar\s*(?:No\.?|#)?\s*(\d+)", text, re.IGNORECASE)
-        if bar_match:
-            sig_block["dc_bar_number"] = bar_match.group(1)
-
-        # Look for email
-        if re.search(r"[\w\.-]+@[\w\.-]+\.\w+", text):
-            sig_block["email"] = True
-
-        # Look for phone
-        if re.search(r"\(\d{3}\)\s*\d{3}[-.\s]?\d{4}", text):
-            sig_block["telephone"] = True
+    def _extract_citations(self, text: str) -> list[str]:
+        """Extract legal citations from text, stopping at MAX_CITATIONS."""
+        citations = []
+        for match in _CITATION_RE.finditer(text):
+            citations.append(match.group(0))
+            if len(citations) >= MAX_CITATIONS:
+                break
+        return citations
 
-        # Look for address (DC)
-        if re.search(r"Washington,?\s*D\.?C\.?\s*\d{5}", text, re.IGNORECASE):
-            sig_block["address"] = True
+    def _scan_text_content(self, text: str) -> dict:
+        """
+        Find the court name, signature block elements and citations in one
+        pass over text.
 
-        return sig_block if sig_block else None
+        Returns {"court_name": bool, "sig_block": dict or None, "citations": list}.
+        Stops early once everything has been seen and the citation limit
+        is reached.
+        """
+        if _HYPERSCAN is not None:
+            return self._scan_text_content_hyperscan(text)
 
-    def _extract_citations(self, text: str) -> list[str]:
-        """Extract legal citations from text."""
+        court_name = False
+        sig_block = {}
         citations = []
 
-        # Federal Reporter citations
-        fed_pattern = r"\d+\s+F\.(?:2d|3d|4th)?\s+\d+"
-        citations.extend(re.findall(fed_pattern, text))
+        for match in _TEXT_SCAN_RE.finditer(text):
+            kind = match.lastgroup
+            if kind == "citation":
+                if len(citations) < MAX_CITATIONS:
+                    citations.append(match.group(0))
+            elif kind == "court_name":
+                court_name = True
+            elif kind not in sig_block:
+                # Keep the DC Bar number itself; other elements are flags
+                sig_block[kind] = (
+                    _BAR_NO_RE.search(match.group(0)).group(0)
+                    if kind == "dc_bar_number" else True
+                )
+
+            if (court_name and len(citations) >= MAX_CITATIONS
+                    and len(sig_block) == len(_SIG_FIELDS)):
+                break
 
-        # US Reports citations
-        us_pattern = r"\d+\s+U\.S\.\s+\d+"
-        citations.extend(re.findall(us_pattern, text))
+        return {
+            "court_name": court_name,
+            "sig_block": sig_block if sig_block else None,
+            "citations": citations,
+        }
 
-        # Supreme Court Reporter
-        sct_pattern = r"\d+\s+S\.?\s*Ct\.?\s+\d+"
-        citations.extend(re.findall(sct_pattern, text))
+    def _scan_text_content_hyperscan(self, text: str) -> dict:
+        """Hyperscan version of _scan_text_content; same return shape."""
+        db, kinds = _HYPERSCAN
+        court_id = len(kinds) - 1
+        data = text.encode("utf-8", "ignore")
+        court_name = False
+        # start offset -> {pattern id: longest end}; Hyperscan reports every end
+        spans = {}
+
+        def on_match(pattern_id, start, end, flags, context):
+            nonlocal court_name
+            if pattern_id == court_id:
+                court_name = True
+                return
+            ends = spans.setdefault(start, {})
+            if end > ends.get(pattern_id, -1):
+                ends[pattern_id] = end
+
+        db.scan(data, match_event_handler=on_match)
+
+        # Replay finditer: leftmost match first, earliest alternative wins at
+        # a given start, and nothing overlapping an accepted match
+        sig_block = {}
+        citations = []
+        last_end = 0
+        for start in sorted(spans):
+            if start < last_end:
+                continue
+            pattern_id = min(spans[start])
+            last_end = spans[start][pattern_id]
+            kind = kinds[pattern_id]
+            if kind == "citation":
+                if len(citations) < MAX_CITATIONS:
+                    citations.append(data[start:last_end].decode("utf-8"))
+            elif kind not in sig_block:
+                sig_block[kind] = (
+                    _BAR_NO_RE.search(data[start:last_end].decode("utf-8")).group(0)
+                    if kind == "dc_bar_number" else True
+                )
 
-        return citations[:20]  # Limit to first 20
+        return {
+            "court_name": court_name,
+            "sig_block": sig_block if sig_block else None,
+            "citations": citations,
+        }
 
 
 # CLI usage
@@ -381,3 +758,5 @@ if __name__ == "__main__":
     print("\n--- Validation Data ---")
     validation_data = analyzer.to_validation_dict()
     print(json.dumps(validation_data, indent=2, default=str))
+
+    analyzer.close()
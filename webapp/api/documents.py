@@ -2,23 +2,369 @@
 Document Generation API Endpoints
 """
 import os
+import re
 import json
+import atexit
+import functools
+import hashlib
+import logging
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from flask import Blueprint, request, jsonify, send_file, current_app
-from io import BytesIO
+from flask import Blueprint, request, send_file, current_app
+from io import StringIO
 import csv
+import orjson
 
 import sys
 from pathlib import Path
+from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.document_generator import DocumentGenerator
 from config import DOCUMENT_TYPES, DC_JUDGES, FORMAT_SPECS, OUTPUT_DIR
 
 documents_bp = Blueprint('documents', __name__, url_prefix='/api')
+logger = logging.getLogger(__name__)
+
+# Case number: 1:YY-cv-NNNNN-ABC (judge initials required)
+CASE_NUMBER_RE = re.compile(r"1:\d{2}-cv-\d{5}-[A-Z]{2,4}")
+
+# Attorney fields required for the LCvR 5.1(d) signature block
+REQUIRED_ATTORNEY_FIELDS = ("name", "address", "phone", "email")
+
+# Fields /generate cannot do without (case_number is optional)
+REQUIRED_GENERATE_FIELDS = ("plaintiff", "defendant", "document_type")
+
+# Listed in the error response for an unknown document type
+VALID_DOCUMENT_TYPES = tuple(DOCUMENT_TYPES)
+
+# Default filing date, reformatted at most once a minute: [expiry, date]
+_DATE_CACHE = [0.0, ""]
+
+# Generated documents are written here and sent from disk; only the newest
+# GENERATED_KEEP files are kept. Files younger than PRUNE_MIN_AGE seconds are
+# never pruned, since another request may still be about to send them.
+GENERATED_DIR = OUTPUT_DIR / "generated"
+GENERATED_KEEP = 100
+PRUNE_MIN_AGE = 60
+
+# The generator only holds its output directory, so one instance is shared
+# by all requests (and threads)
+_generator = DocumentGenerator(str(GENERATED_DIR))
+
+# PDFs are rendered in a process pool so several can be built on separate
+# cores without tying up the request thread's GIL. At most PDF_MAX_PENDING
+# renders are accepted per worker process; past that the endpoint answers 503.
+PDF_POOL_WORKERS = min(os.cpu_count() or 1, 4)
+PDF_MAX_PENDING = PDF_POOL_WORKERS * 4
+PDF_TIMEOUT = 30
+
+_pdf_pool = None
+_pdf_pending = 0
+_pdf_lock = threading.Lock()
+
+# Documents generated from identical requests are reused. The cache is the
+# directory itself, shared by all workers: files are named by request hash
+# and the least recently used (by mtime) are evicted past the limits.
+DOC_CACHE_DIR = OUTPUT_DIR / "cache"
+DOC_CACHE_MAX_ENTRIES = 64
+DOC_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Case number characters replaced in draft filenames
+DRAFT_NAME_TABLE = str.maketrans(":-", "__")
+# Names save_draft produces; anything else (other files in OUTPUT_DIR, path
+# tricks) is answered with 404 without touching the disk. The case number part
+# may be empty: drafts saved before blank case numbers became "draft" have it so
+DRAFT_FILENAME_RE = re.compile(r"draft_[^/\\]*_\d{8}_\d{6}\.json")
+
+# One JSON line per saved draft with the fields list_drafts shows, so the
+# listing doesn't have to parse every draft; later lines win
+DRAFTS_INDEX_FILE = OUTPUT_DIR / "drafts_index.jsonl"
 
 # User registrations file
 USERS_FILE = OUTPUT_DIR / "registered_users.csv"
+USER_FIELDS = ['name', 'email', 'organization', 'phone', 'registered_at', 'ip_address', 'user_agent']
+
+# Registrations are queued by the request and appended to USERS_FILE in
+# batches by a background thread, every USER_FLUSH_INTERVAL seconds or as
+# soon as USER_FLUSH_THRESHOLD records are waiting. The queue is bounded;
+# when it is full the endpoint answers 503 instead of queueing more.
+USER_FLUSH_INTERVAL = 1.0
+USER_FLUSH_THRESHOLD = 128
+USER_QUEUE_SIZE = 4096
+
+_user_queue = queue.Queue(maxsize=USER_QUEUE_SIZE)
+_user_flush_lock = threading.Lock()
+_user_flush_event = threading.Event()
+_user_writer = None
+_user_writer_lock = threading.Lock()
+_users_file = None
+
+
+def _flush_users():
+    """Append all queued registrations to USERS_FILE."""
+    global _users_file
+
+    with _user_flush_lock:
+        pending = []
+        try:
+            while True:
+                pending.append(_user_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not pending:
+            return
+
+        written = 0
+        try:
+            if _users_file is None:
+                OUTPUT_DIR.mkdir(exist_ok=True)
+                # Opened once per process, unbuffered, and kept open for appends
+                _users_file = open(USERS_FILE, 'ab', buffering=0)
+            # The whole batch is formatted first and appended with as few
+            # writes as the OS allows, so a failure can't leave some rows on
+            # disk and the same rows queued for a retry
+            buf = StringIO(newline='')
+            writer = csv.DictWriter(buf, fieldnames=USER_FIELDS)
+            if _users_file.tell() == 0:
+                writer.writeheader()
+            writer.writerows(pending)
+            data = buf.getvalue().encode('utf-8')
+            while written < len(data):
+                written += _users_file.write(data[written:])
+        except Exception:
+            if written:
+                logger.error(f"Registration flush interrupted after {written} bytes; "
+                             f"{len(pending)} record(s) not retried")
+                raise
+            # Nothing reached the file; re-queue the records so the next
+            # flush retries them
+            for record in pending:
+                try:
+                    _user_queue.put_nowait(record)
+                except queue.Full:
+                    logger.error(f"Registration dropped: {record['email']}")
+            raise
+
+        logger.info(f"Saved {len(pending)} user registration(s)")
+
+
+def _user_writer_loop():
+    """Background thread: flush queued registrations periodically."""
+    while True:
+        _user_flush_event.wait(USER_FLUSH_INTERVAL)
+        _user_flush_event.clear()
+        try:
+            _flush_users()
+        except Exception as e:
+            logger.error(f"Registration flush error: {str(e)}")
+
+
+def _start_user_writer():
+    """Start the registration writer on first use (after any worker fork)."""
+    global _user_writer
+
+    with _user_writer_lock:
+        if _user_writer is not None:
+            return
+        _user_writer = threading.Thread(target=_user_writer_loop, name="user-writer", daemon=True)
+        _user_writer.start()
+    atexit.register(_flush_users)
+
+
+# Parsed USERS_FILE rows; each call only parses what was appended since the
+# last one (the file is append-only, written by every worker process)
+_users_cache = []
+_users_cache_header = None
+_users_cache_offset = 0
+_users_cache_stat = None
+_users_cache_lock = threading.Lock()
+
+
+def _load_users() -> list:
+    """Return all registered users, reading only new rows from USERS_FILE."""
+    global _users_cache_header, _users_cache_offset, _users_cache_stat
+
+    try:
+        st = USERS_FILE.stat()
+    except FileNotFoundError:
+        st = None
+
+    with _users_cache_lock:
+        if st is None or _users_cache_stat is None or st.st_ino != _users_cache_stat.st_ino \
+                or st.st_size < _users_cache_offset:
+            # First read, or the file was removed/replaced: start over
+            _users_cache.clear()
+            _users_cache_header = None
+            _users_cache_offset = 0
+        _users_cache_stat = st
+        if st is None or st.st_size == _users_cache_offset:
+            return _users_cache[:]
+
+        with open(USERS_FILE, 'rb') as f:
+            f.seek(_users_cache_offset)
+            tail = f.read()
+
+        # Only take complete lines; a partial last row is picked up next time
+        end = tail.rfind(b'\n') + 1
+        if end:
+            reader = csv.DictReader(StringIO(tail[:end].decode('utf-8')), fieldnames=_users_cache_header)
+            _users_cache.extend(reader)
+            _users_cache_header = reader.fieldnames
+            _users_cache_offset += end
+
+        return _users_cache[:]
+
+
+def _submit_pdf(data: dict):
+    """Queue a PDF render in the pool; None when too many are already pending."""
+    global _pdf_pool, _pdf_pending
+
+    with _pdf_lock:
+        if _pdf_pending >= PDF_MAX_PENDING:
+            return None
+        if _pdf_pool is None:
+            # Created on first use, i.e. in the worker process after any fork
+            _pdf_pool = ProcessPoolExecutor(max_workers=PDF_POOL_WORKERS)
+        future = _pdf_pool.submit(_generator.generate_to_file, data, "pdf")
+        _pdf_pending += 1
+    future.add_done_callback(_pdf_done)
+    return future
+
+
+def _pdf_done(future):
+    global _pdf_pool, _pdf_pending
+
+    with _pdf_lock:
+        _pdf_pending -= 1
+        if isinstance(future.exception(), BrokenProcessPool):
+            # A render process died; start a fresh pool on the next request
+            _pdf_pool = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _modified_str(mtime: float) -> str:
+    """ISO timestamp for a draft's mtime; drafts rarely change, so repeat listings hit the cache."""
+    return datetime.fromtimestamp(mtime).isoformat()
+
+
+def _today_str() -> str:
+    """Today's date as used on filings, e.g. 'January 15, 2025'."""
+    now = time.time()
+    if now >= _DATE_CACHE[0]:
+        # Expire on the next minute boundary so the date rolls over on time
+        _DATE_CACHE[1] = datetime.fromtimestamp(now).strftime("%B %d, %Y")
+        _DATE_CACHE[0] = (now // 60 + 1) * 60
+    return _DATE_CACHE[1]
+
+
+def _prune_dir(directory: Path, max_files: int, max_bytes: Optional[int] = None):
+    """Delete the least recently modified files in directory beyond the limits.
+
+    Files modified within the last PRUNE_MIN_AGE seconds are left alone.
+    """
+    with os.scandir(directory) as it:
+        files = [e for e in it if e.is_file() and not e.name.endswith(".tmp")]
+    if len(files) <= max_files and max_bytes is None:
+        return
+
+    # Other requests and workers prune the same directory, so entries can
+    # vanish between the scan and the stat; those are skipped
+    stats = []
+    for e in files:
+        try:
+            st = e.stat()
+        except FileNotFoundError:
+            continue
+        stats.append((st.st_mtime, st.st_size, e.path))
+
+    # Newest first; keep files until either limit is reached, but always the
+    # newest one (the file about to be sent)
+    files = sorted(stats, reverse=True)
+    cutoff = time.time() - PRUNE_MIN_AGE
+    total = 0
+    for i, (mtime, size, path) in enumerate(files):
+        total += size
+        if mtime > cutoff:
+            continue
+        if i and (i >= max_files or (max_bytes is not None and total > max_bytes)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _document_cache_path(data: dict, output_format: str) -> Path:
+    """Cache path for a generate request, named by a stable hash of it."""
+    payload = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    key = hashlib.blake2b(f"{output_format}:{payload}".encode(), digest_size=16).hexdigest()
+    return DOC_CACHE_DIR / f"{key}.{output_format}"
+
+
+# Parsed DRAFTS_INDEX_FILE (filename -> entry), read incrementally like the
+# users file
+_draft_index = {}
+_draft_index_offset = 0
+_draft_index_stat = None
+_draft_index_lock = threading.Lock()
+
+
+def _index_draft(filename: str, data: dict) -> dict:
+    """Append a draft's listing fields to DRAFTS_INDEX_FILE and return them."""
+    entry = {
+        "filename": filename,
+        "case_number": data.get("case_number", "Unknown"),
+        "document_type": data.get("document_type", "Unknown")
+    }
+    # Single append write per entry, so concurrent workers don't interleave
+    with open(DRAFTS_INDEX_FILE, 'ab') as f:
+        f.write(orjson.dumps(entry) + b"\n")
+    return entry
+
+
+def _load_draft_index() -> dict:
+    """Return the draft index, reading only entries appended since the last call."""
+    global _draft_index_offset, _draft_index_stat
+
+    try:
+        st = DRAFTS_INDEX_FILE.stat()
+    except FileNotFoundError:
+        st = None
+
+    with _draft_index_lock:
+        if st is None or _draft_index_stat is None or st.st_ino != _draft_index_stat.st_ino \
+                or st.st_size < _draft_index_offset:
+            _draft_index.clear()
+            _draft_index_offset = 0
+        _draft_index_stat = st
+        if st is not None and st.st_size > _draft_index_offset:
+            with open(DRAFTS_INDEX_FILE, 'rb') as f:
+                f.seek(_draft_index_offset)
+                tail = f.read()
+            end = tail.rfind(b"\n") + 1
+            for line in tail[:end].splitlines():
+                entry = orjson.loads(line)
+                _draft_index[entry["filename"]] = entry
+            _draft_index_offset += end
+
+        return dict(_draft_index)
+
+
+def _json_response(payload, status: int = 200):
+    """JSON response serialized with orjson (bytes straight into the response)."""
+    return current_app.response_class(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+def _json_body():
+    """Parse the request body with orjson; None when the body is empty."""
+    # cache=False: the raw bytes are only needed for this one parse
+    raw = request.get_data(cache=False)
+    return orjson.loads(raw) if raw else None
 
 
 @documents_bp.route('/register-user', methods=['POST'])
@@ -28,14 +374,14 @@ def register_user():
     This data is collected for lead tracking purposes.
     """
     try:
-        data = request.get_json()
+        data = _json_body()
 
         if not data:
-            return jsonify({"error": "No data provided"}), 400
+            return _json_response({"error": "No data provided"}, 400)
 
         # Validate required fields
         if not data.get('name') or not data.get('email'):
-            return jsonify({"error": "Name and email are required"}), 400
+            return _json_response({"error": "Name and email are required"}, 400)
 
         # Prepare user record
         user_record = {
@@ -48,27 +394,23 @@ def register_user():
             'user_agent': request.headers.get('User-Agent', '')[:200]
         }
 
-        # Ensure output directory exists
-        OUTPUT_DIR.mkdir(exist_ok=True)
-
-        # Append to CSV file
-        file_exists = USERS_FILE.exists()
-        with open(USERS_FILE, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=user_record.keys())
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(user_record)
+        # Queue for the background writer, which also does the logging
+        _start_user_writer()
+        try:
+            _user_queue.put_nowait(user_record)
+        except queue.Full:
+            return _json_response({"error": "Registration service busy, please retry"}, 503)
+        if _user_queue.qsize() >= USER_FLUSH_THRESHOLD:
+            _user_flush_event.set()
 
-        current_app.logger.info(f"New user registered: {user_record['email']}")
-
-        return jsonify({
+        return _json_response({
             "success": True,
             "message": "Registration successful"
         })
 
     except Exception as e:
         current_app.logger.error(f"Registration error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
 
 
 @documents_bp.route('/users', methods=['GET'])
@@ -78,23 +420,35 @@ def list_users():
     In production, this should be protected with authentication.
     """
     try:
-        if not USERS_FILE.exists():
-            return jsonify({"users": [], "count": 0})
-
-        users = []
-        with open(USERS_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                users.append(row)
+        users = _load_users()
 
-        return jsonify({
+        return _json_response({
             "users": users,
             "count": len(users)
         })
 
     except Exception as e:
         current_app.logger.error(f"List users error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
+
+
+@documents_bp.route('/users.ndjson', methods=['GET'])
+def stream_users():
+    """
+    Stream all registered users as newline-delimited JSON, one user per line.
+    Same data as /users, without building the whole response body in memory.
+    """
+    try:
+        users = _load_users()
+    except Exception as e:
+        current_app.logger.error(f"List users error: {str(e)}")
+        return _json_response({"error": str(e)}, 500)
+
+    def generate():
+        for user in users:
+            yield orjson.dumps(user, option=orjson.OPT_APPEND_NEWLINE)
+
+    return current_app.response_class(generate(), mimetype="application/x-ndjson")
 
 
 @documents_bp.route('/generate', methods=['POST'])
@@ -140,51 +494,156 @@ def generate_document():
     }
     """
     try:
-        data = request.get_json()
+        data = _json_body()
 
         if not data:
-            return jsonify({"error": "No data provided"}), 400
+            return _json_response({"error": "No data provided"}, 400)
 
         # Validate required fields (case_number is now optional)
-        required_fields = ["plaintiff", "defendant", "document_type"]
-        missing = [f for f in required_fields if not data.get(f)]
+        missing = [f for f in REQUIRED_GENERATE_FIELDS if not data.get(f)]
         if missing:
-            return jsonify({"error": f"Missing required fields: {', '.join(missing)}"}), 400
+            return _json_response({"error": f"Missing required fields: {', '.join(missing)}"}, 400)
 
         # Validate document type
         doc_type = data.get("document_type")
         if doc_type not in DOCUMENT_TYPES:
-            return jsonify({
+            return _json_response({
                 "error": f"Invalid document type: {doc_type}",
-                "valid_types": list(DOCUMENT_TYPES.keys())
-            }), 400
+                "valid_types": VALID_DOCUMENT_TYPES
+            }, 400)
 
         # Get format
         output_format = data.get("format", "docx").lower()
-        if output_format not in ["docx", "pdf"]:
-            return jsonify({"error": "Format must be 'docx' or 'pdf'"}), 400
+        if output_format not in ("docx", "pdf"):
+            return _json_response({"error": "Format must be 'docx' or 'pdf'"}, 400)
+
+        # Repeat requests reuse the earlier document. Requests without a date
+        # get today's date, so they are never cached.
+        cache_path = _document_cache_path(data, output_format) if data.get("date") else None
 
         # Set default date if not provided
         if not data.get("date"):
-            data["date"] = datetime.now().strftime("%B %d, %Y")
-
-        # Generate document
-        generator = DocumentGenerator(str(OUTPUT_DIR))
-        filename, file_bytes = generator.generate(data, output_format)
+            data["date"] = _today_str()
+
+        path = None
+        if cache_path:
+            # Cache hit: mark as recently used. Another worker may prune the
+            # entry at any point; a miss just generates it again.
+            try:
+                os.utime(cache_path)
+            except FileNotFoundError:
+                pass
+            else:
+                filename, path = _generator.filename_for(data, output_format), cache_path
+
+        if path is None:
+            # Generate document straight to disk
+            if output_format == "pdf":
+                future = _submit_pdf(data)
+                if future is None:
+                    return _json_response({"error": "Server busy generating documents, try again shortly"}, 503)
+                try:
+                    filename, path = future.result(timeout=PDF_TIMEOUT)
+                except FutureTimeoutError:
+                    return _json_response({"error": "Document generation timed out"}, 504)
+            else:
+                filename, path = _generator.generate_to_file(data, output_format)
+            if cache_path:
+                DOC_CACHE_DIR.mkdir(exist_ok=True)
+                os.replace(path, cache_path)
+                path = cache_path
+                _prune_dir(DOC_CACHE_DIR, DOC_CACHE_MAX_ENTRIES, DOC_CACHE_MAX_BYTES)
+            else:
+                _prune_dir(GENERATED_DIR, GENERATED_KEEP)
 
-        # Return the file
+        # Return the file; sent from disk (sendfile where the server supports it)
         mimetype = "application/vnd.openxmlformats-officedocument.wordprocessingml.document" if output_format == "docx" else "application/pdf"
 
         return send_file(
-            BytesIO(file_bytes),
+            path,
             mimetype=mimetype,
             as_attachment=True,
-            download_name=filename
+            download_name=filename,
+            conditional=True
         )
 
     except Exception as e:
         current_app.logger.error(f"Document generation error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
+
+
+# Validation checks, run in order by validate_document. Each takes the
+# request data and returns (outcome, check, message, rule) or None when it
+# has nothing to report; passed checks may have no rule.
+PASSED, WARNING, ERROR = "passed", "warning", "error"
+
+
+def _check_case_number(data):
+    # Only validated if provided
+    case_number = data.get("case_number", "")
+    if not case_number:
+        return WARNING, "case_number_missing", "Case number not provided. You can add it later before filing.", "LCvR 5.1(b)"
+    if not CASE_NUMBER_RE.match(case_number):
+        return (ERROR, "case_number_format",
+                f"Case number '{case_number}' invalid. Format: 1:YY-cv-NNNNN-ABC (must include judge initials)",
+                "LCvR 5.1(b)")
+    return PASSED, "case_number_format", "Case number format valid", None
+
+
+def _check_page_limit(data):
+    doc_type = data.get("document_type")
+    doc_config = DOCUMENT_TYPES.get(doc_type)
+    if doc_config is None:
+        return ERROR, "document_type", f"Unknown document type: {doc_type}", "N/A"
+    max_pages = doc_config.get("max_pages")
+    if max_pages:
+        return (PASSED, "page_limit",
+                f"Document type '{doc_config['name']}' has {max_pages}-page limit", "LCvR 7(n)(1)")
+    return None
+
+
+def _check_signature_block(data):
+    attorney = data.get("attorney", {})
+    missing = [f for f in REQUIRED_ATTORNEY_FIELDS if not attorney.get(f)]
+    if missing:
+        return ERROR, "signature_block", f"Signature block missing: {', '.join(missing)}", "LCvR 5.1(d)"
+    return PASSED, "signature_block", "Signature block complete", None
+
+
+def _check_dc_bar_number(data):
+    if not data.get("attorney", {}).get("dc_bar_number"):
+        return WARNING, "dc_bar_number", "DC Bar number not provided (required for DC Bar members)", "LCvR 5.1(d)"
+    return PASSED, "dc_bar_number", "DC Bar number provided", None
+
+
+def _check_content(data):
+    sections = data.get("sections", {})
+    if not (sections.get("introduction") or sections.get("argument") or sections.get("conclusion")):
+        return WARNING, "content", "Document appears to have minimal content", "N/A"
+    return None
+
+
+def _check_plaintiff(data):
+    if not data.get("plaintiff"):
+        return ERROR, "plaintiff", "Plaintiff name required", "LCvR 5.1(b)"
+    return None
+
+
+def _check_defendant(data):
+    if not data.get("defendant"):
+        return ERROR, "defendant", "Defendant name required", "LCvR 5.1(b)"
+    return None
+
+
+VALIDATION_CHECKS = (
+    _check_case_number,
+    _check_page_limit,
+    _check_signature_block,
+    _check_dc_bar_number,
+    _check_content,
+    _check_plaintiff,
+    _check_defendant,
+)
 
 
 @documents_bp.route('/validate', methods=['POST'])
@@ -192,201 +651,177 @@ def validate_document():
     """
     Validate document metadata against DC court rules.
 
-    Expected JSON body: Same as /generate endpoint
+    Expected JSON body: Same as /generate endpoint. Set "summary_only"
+    in the body (or ?summary=1) to get just the verdict and counts.
     """
     try:
-        data = request.get_json()
+        data = _json_body()
 
         if not data:
-            return jsonify({"error": "No data provided"}), 400
-
-        errors = []
-        warnings = []
-        passed = []
-
-        # Validate case number format (only if provided)
-        case_number = data.get("case_number", "")
-        import re
-        if case_number:
-            if not re.match(r"1:\d{2}-cv-\d{5}-[A-Z]{2,4}", case_number):
-                errors.append({
-                    "check": "case_number_format",
-                    "message": f"Case number '{case_number}' invalid. Format: 1:YY-cv-NNNNN-ABC (must include judge initials)",
-                    "rule": "LCvR 5.1(b)"
-                })
-            else:
-                passed.append({"check": "case_number_format", "message": "Case number format valid"})
-        else:
-            warnings.append({
-                "check": "case_number_missing",
-                "message": "Case number not provided. You can add it later before filing.",
-                "rule": "LCvR 5.1(b)"
-            })
-
-        # Validate document type and page limits
-        doc_type = data.get("document_type")
-        if doc_type in DOCUMENT_TYPES:
-            doc_config = DOCUMENT_TYPES[doc_type]
-            max_pages = doc_config.get("max_pages")
-            if max_pages:
-                passed.append({
-                    "check": "page_limit",
-                    "message": f"Document type '{doc_config['name']}' has {max_pages}-page limit",
-                    "rule": "LCvR 7(n)(1)"
-                })
-        else:
-            errors.append({
-                "check": "document_type",
-                "message": f"Unknown document type: {doc_type}",
-                "rule": "N/A"
-            })
-
-        # Validate attorney information
-        attorney = data.get("attorney", {})
-        required_attorney_fields = ["name", "address", "phone", "email"]
-        missing_attorney = [f for f in required_attorney_fields if not attorney.get(f)]
-        if missing_attorney:
-            errors.append({
-                "check": "signature_block",
-                "message": f"Signature block missing: {', '.join(missing_attorney)}",
-                "rule": "LCvR 5.1(d)"
-            })
-        else:
-            passed.append({"check": "signature_block", "message": "Signature block complete"})
-
-        # Check DC Bar number
-        if not attorney.get("dc_bar_number"):
-            warnings.append({
-                "check": "dc_bar_number",
-                "message": "DC Bar number not provided (required for DC Bar members)",
-                "rule": "LCvR 5.1(d)"
-            })
-        else:
-            passed.append({"check": "dc_bar_number", "message": "DC Bar number provided"})
-
-        # Validate required content sections
-        sections = data.get("sections", {})
-        if not any([sections.get("introduction"), sections.get("argument"), sections.get("conclusion")]):
-            warnings.append({
-                "check": "content",
-                "message": "Document appears to have minimal content",
-                "rule": "N/A"
+            return _json_response({"error": "No data provided"}, 400)
+
+        summary_only = bool(data.get("summary_only")) or request.args.get("summary") == "1"
+
+        results = {ERROR: [], WARNING: [], PASSED: []}
+        counts = dict.fromkeys(results, 0)
+        for check in VALIDATION_CHECKS:
+            outcome = check(data)
+            if outcome is None:
+                continue
+            kind, check_id, message, rule = outcome
+            counts[kind] += 1
+            if not summary_only:
+                entry = {"check": check_id, "message": message}
+                if rule:
+                    entry["rule"] = rule
+                results[kind].append(entry)
+
+        if summary_only:
+            return _json_response({
+                "is_valid": not counts[ERROR],
+                "error_count": counts[ERROR],
+                "warning_count": counts[WARNING],
+                "pass_count": counts[PASSED]
             })
 
-        # Validate parties
-        if not data.get("plaintiff"):
-            errors.append({"check": "plaintiff", "message": "Plaintiff name required", "rule": "LCvR 5.1(b)"})
-        if not data.get("defendant"):
-            errors.append({"check": "defendant", "message": "Defendant name required", "rule": "LCvR 5.1(b)"})
-
-        return jsonify({
-            "is_valid": len(errors) == 0,
-            "total_checks": len(errors) + len(warnings) + len(passed),
-            "errors": errors,
-            "warnings": warnings,
-            "passed": passed
+        return _json_response({
+            "is_valid": not counts[ERROR],
+            "total_checks": sum(counts.values()),
+            "errors": results[ERROR],
+            "warnings": results[WARNING],
+            "passed": results[PASSED]
         })
 
     except Exception as e:
         current_app.logger.error(f"Validation error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
+
+
+# Payloads for the static reference endpoints; they never change while the
+# process runs, so each is serialized once and served with an ETag
+TEMPLATES = [
+    {
+        "id": key,
+        "name": config["name"],
+        "title": config["title"],
+        "category": config["category"],
+        "max_pages": config.get("max_pages")
+    }
+    for key, config in DOCUMENT_TYPES.items()
+]
+
+RULES = {
+    "format_specs": FORMAT_SPECS,
+    "page_limits": {
+        "motion": 45,
+        "opposition": 45,
+        "reply": 25
+    },
+    "rules": [
+        {
+            "id": "LCvR 5.1(a)",
+            "title": "Paper Requirements",
+            "description": "8.5 x 11 inch white paper, black text"
+        },
+        {
+            "id": "LCvR 5.1(b)",
+            "title": "Caption Requirements",
+            "description": "Must include court name, parties, case number with judge initials"
+        },
+        {
+            "id": "LCvR 5.1(d)",
+            "title": "Signature Block",
+            "description": "Must include attorney name, address, phone, email, DC Bar number"
+        },
+        {
+            "id": "LCvR 7(n)(1)",
+            "title": "Page Limits",
+            "description": "Motions: 45 pages, Replies: 25 pages"
+        },
+        {
+            "id": "LCvR 7(o)(1)",
+            "title": "Format Requirements",
+            "description": "Times New Roman 12pt, double-spaced, 1-inch margins, 2 spaces between sentences"
+        },
+        {
+            "id": "LCvR 7(o)(2)",
+            "title": "Pin Cites",
+            "description": "All citations must include page references"
+        },
+        {
+            "id": "LCvR 5.3",
+            "title": "Certificate of Service",
+            "description": "Required for all filings except case initiation"
+        },
+        {
+            "id": "LCvR 5.4",
+            "title": "ECF Requirements",
+            "description": "Text-searchable PDF required for filing"
+        }
+    ]
+}
+
+STATIC_MAX_AGE = 3600  # seconds
+_static_json_cache = {}
+
+
+def _static_json_response(key: str, payload):
+    """Return payload as JSON, serializing it only on the first call for key."""
+    cached = _static_json_cache.get(key)
+    if cached is None:
+        body = orjson.dumps(payload)
+        cached = _static_json_cache[key] = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+
+    body, etag = cached
+    response = current_app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_MAX_AGE
+    return response.make_conditional(request)
 
 
 @documents_bp.route('/templates', methods=['GET'])
 def list_templates():
     """Get list of available document templates."""
-    templates = []
-    for key, config in DOCUMENT_TYPES.items():
-        templates.append({
-            "id": key,
-            "name": config["name"],
-            "title": config["title"],
-            "category": config["category"],
-            "max_pages": config.get("max_pages")
-        })
-    return jsonify({"templates": templates})
+    return _static_json_response("templates", {"templates": TEMPLATES})
 
 
 @documents_bp.route('/judges', methods=['GET'])
 def list_judges():
     """Get list of DC District Court judges."""
-    return jsonify({"judges": DC_JUDGES})
+    return _static_json_response("judges", {"judges": DC_JUDGES})
 
 
 @documents_bp.route('/rules', methods=['GET'])
 def get_rules():
     """Get formatting rules."""
-    return jsonify({
-        "format_specs": FORMAT_SPECS,
-        "page_limits": {
-            "motion": 45,
-            "opposition": 45,
-            "reply": 25
-        },
-        "rules": [
-            {
-                "id": "LCvR 5.1(a)",
-                "title": "Paper Requirements",
-                "description": "8.5 x 11 inch white paper, black text"
-            },
-            {
-                "id": "LCvR 5.1(b)",
-                "title": "Caption Requirements",
-                "description": "Must include court name, parties, case number with judge initials"
-            },
-            {
-                "id": "LCvR 5.1(d)",
-                "title": "Signature Block",
-                "description": "Must include attorney name, address, phone, email, DC Bar number"
-            },
-            {
-                "id": "LCvR 7(n)(1)",
-                "title": "Page Limits",
-                "description": "Motions: 45 pages, Replies: 25 pages"
-            },
-            {
-                "id": "LCvR 7(o)(1)",
-                "title": "Format Requirements",
-                "description": "Times New Roman 12pt, double-spaced, 1-inch margins, 2 spaces between sentences"
-            },
-            {
-                "id": "LCvR 7(o)(2)",
-                "title": "Pin Cites",
-                "description": "All citations must include page references"
-            },
-            {
-                "id": "LCvR 5.3",
-                "title": "Certificate of Service",
-                "description": "Required for all filings except case initiation"
-            },
-            {
-                "id": "LCvR 5.4",
-                "title": "ECF Requirements",
-                "description": "Text-searchable PDF required for filing"
-            }
-        ]
-    })
+    return _static_json_response("rules", RULES)
 
 
 @documents_bp.route('/drafts', methods=['POST'])
 def save_draft():
     """Save a document draft."""
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data:
-            return jsonify({"error": "No data provided"}), 400
+            return _json_response({"error": "No data provided"}, 400)
 
         # Generate draft ID
-        draft_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        case_number = data.get("case_number", "draft").replace(":", "_").replace("-", "_")
+        draft_id = time.strftime("%Y%m%d_%H%M%S")
+        case_number = (data.get("case_number") or "").strip() or "draft"
+        case_number = case_number.translate(DRAFT_NAME_TABLE)
         filename = f"draft_{case_number}_{draft_id}.json"
 
-        # Save to output directory
+        # Save to output directory; written to a temp file and renamed so a
+        # reader never sees a partial draft
         draft_path = OUTPUT_DIR / filename
-        with open(draft_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        with tempfile.NamedTemporaryFile(dir=OUTPUT_DIR, prefix=".draft_", suffix=".tmp", delete=False) as f:
+            f.write(payload)
+        os.replace(f.name, draft_path)
+        _index_draft(filename, data)
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "draft_id": draft_id,
             "filename": filename
@@ -394,64 +829,76 @@ def save_draft():
 
     except Exception as e:
         current_app.logger.error(f"Save draft error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
 
 
 @documents_bp.route('/drafts', methods=['GET'])
 def list_drafts():
     """List saved drafts."""
     try:
+        index = _load_draft_index()
+        with os.scandir(OUTPUT_DIR) as it:
+            rows = [(e.stat().st_mtime, e.name, e.path) for e in it
+                    if e.name.startswith("draft_") and e.name.endswith(".json")]
+
+        # Sort by modified date, newest first
+        rows.sort(reverse=True)
+
         drafts = []
-        for file in OUTPUT_DIR.glob("draft_*.json"):
-            with open(file, 'r') as f:
-                data = json.load(f)
+        for mtime, name, path in rows:
+            entry = index.get(name)
+            if entry is None:
+                # Saved before the index existed: read it once and index it
+                with open(path, 'rb') as f:
+                    entry = _index_draft(name, json.load(f))
             drafts.append({
-                "filename": file.name,
-                "case_number": data.get("case_number", "Unknown"),
-                "document_type": data.get("document_type", "Unknown"),
-                "modified": datetime.fromtimestamp(file.stat().st_mtime).isoformat()
+                "filename": name,
+                "case_number": entry["case_number"],
+                "document_type": entry["document_type"],
+                "modified": _modified_str(mtime)
             })
 
-        # Sort by modified date, newest first
-        drafts.sort(key=lambda x: x["modified"], reverse=True)
-
-        return jsonify({"drafts": drafts})
+        return _json_response({"drafts": drafts})
 
     except Exception as e:
         current_app.logger.error(f"List drafts error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
 
 
 @documents_bp.route('/drafts/<filename>', methods=['GET'])
 def load_draft(filename):
     """Load a saved draft."""
     try:
-        draft_path = OUTPUT_DIR / filename
-        if not draft_path.exists():
-            return jsonify({"error": "Draft not found"}), 404
+        if not DRAFT_FILENAME_RE.fullmatch(filename):
+            return _json_response({"error": "Draft not found"}, 404)
 
-        with open(draft_path, 'r') as f:
-            data = json.load(f)
+        try:
+            with open(OUTPUT_DIR / filename, 'rb') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return _json_response({"error": "Draft not found"}, 404)
 
-        return jsonify(data)
+        return _json_response(data)
 
     except Exception as e:
         current_app.logger.error(f"Load draft error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
 
 
 @documents_bp.route('/drafts/<filename>', methods=['DELETE'])
 def delete_draft(filename):
     """Delete a saved draft."""
     try:
-        draft_path = OUTPUT_DIR / filename
-        if not draft_path.exists():
-            return jsonify({"error": "Draft not found"}), 404
+        if not DRAFT_FILENAME_RE.fullmatch(filename):
+            return _json_response({"error": "Draft not found"}, 404)
 
-        draft_path.unlink()
+        try:
+            (OUTPUT_DIR / filename).unlink()
+        except FileNotFoundError:
+            return _json_response({"error": "Draft not found"}, 404)
 
-        return jsonify({"success": True})
+        return _json_response({"success": True})
 
     except Exception as e:
         current_app.logger.error(f"Delete draft error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+        return _json_response({"error": str(e)}, 500)
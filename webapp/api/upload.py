@@ -4,24 +4,96 @@ Document Upload API Endpoints
 Provides endpoints for uploading, extracting, and reformatting documents.
 """
 import os
+import re
+import time
+import uuid
 import logging
-from io import BytesIO
+import zipfile
+import tempfile
+import threading
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote
 from datetime import datetime
-from flask import Blueprint, request, jsonify, send_file
+from flask import Blueprint, request, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
+import orjson
 
 import sys
 from pathlib import Path
+from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from services.document_processor import DocumentProcessor, process_and_reformat
-from config import Config, DOCUMENT_TYPES
+from config import Config, DOCUMENT_TYPES, OUTPUT_DIR
 
 upload_bp = Blueprint('upload', __name__, url_prefix='/api/upload')
 logger = logging.getLogger(__name__)
 
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {'docx'}
-MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB
+DOCX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+# Error for an unknown doc_type in /reformat
+INVALID_DOC_TYPE_MSG = f"Invalid document type. Valid types: {', '.join(DOCUMENT_TYPES)}"
+
+# Uploads sent with ?async=1 are extracted in a process pool instead of in
+# the request. The upload is saved as <job_id>.docx and the finished response
+# written to <job_id>.json, so /status works from any worker process. Job
+# files older than UPLOAD_JOB_TTL seconds are removed.
+UPLOAD_JOBS_DIR = OUTPUT_DIR / "upload_jobs"
+UPLOAD_JOB_TTL = 3600
+UPLOAD_JOB_ID_RE = re.compile(r"[0-9a-f]{32}")
+UPLOAD_POOL_WORKERS = min(os.cpu_count() or 1, 4)
+UPLOAD_MAX_PENDING = UPLOAD_POOL_WORKERS * 4
+
+_upload_pool = None
+_upload_pending = 0
+_upload_lock = threading.Lock()
+
+# Sections shown by /preview, in document order, and how much of each
+PREVIEW_SECTIONS = (
+    ("introduction", "INTRODUCTION"),
+    ("facts", "FACTUAL BACKGROUND"),
+    ("legal_standard", "LEGAL STANDARD"),
+    ("argument", "ARGUMENT"),
+    ("conclusion", "CONCLUSION"),
+)
+PREVIEW_SECTION_CHARS = 500
+
+# Response body for /document-types; DOCUMENT_TYPES never changes while the
+# process runs, so it is serialized once
+DOCUMENT_TYPES_JSON = orjson.dumps({
+    "document_types": [
+        {
+            "id": key,
+            "name": config["name"],
+            "title": config["title"],
+            "category": config["category"],
+            "max_pages": config.get("max_pages")
+        }
+        for key, config in DOCUMENT_TYPES.items()
+    ]
+})
+
+
+def _json_response(payload, status: int = 200):
+    """JSON response serialized with orjson (bytes straight into the response)."""
+    return current_app.response_class(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+def _attachment_response(body: bytes, mimetype: str, filename: str):
+    """Download response for an in-memory file."""
+    response = current_app.response_class(body, mimetype=mimetype)
+    try:
+        filename.encode("ascii")
+        response.headers.set("Content-Disposition", "attachment", filename=filename)
+    except UnicodeEncodeError:
+        # Same fallback as send_file: ASCII name plus the RFC 5987 UTF-8 one
+        simple = unicodedata.normalize("NFKD", filename).encode("ascii", "ignore").decode("ascii")
+        response.headers.set("Content-Disposition", "attachment", filename=simple,
+                             **{"filename*": f"UTF-8''{quote(filename, safe='')}"})
+    return response
 
 
 def allowed_file(filename: str) -> bool:
@@ -29,6 +101,101 @@ def allowed_file(filename: str) -> bool:
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def is_docx(stream) -> bool:
+    """Check that stream is a zip holding word/document.xml (reads only the zip directory)."""
+    try:
+        with zipfile.ZipFile(stream) as zf:
+            zf.getinfo('word/document.xml')
+        return True
+    except (zipfile.BadZipFile, KeyError):
+        return False
+    finally:
+        stream.seek(0)
+
+
+def _upload_payload(filename: str, content: dict) -> dict:
+    """Response body for an extracted upload."""
+    return {
+        "success": True,
+        "filename": filename,
+        "extracted": {
+            "full_text": content["full_text"],
+            "paragraphs": content["paragraphs"],
+            "case_info": content["case_info"],
+            "sections": content["sections"],
+            "word_count": content["word_count"],
+            "paragraph_count": content["paragraph_count"]
+        }
+    }
+
+
+def _run_upload_job(job_id: str, filename: str):
+    """Extract a saved upload (in a pool process) and write the job's result file."""
+    source = UPLOAD_JOBS_DIR / f"{job_id}.docx"
+    try:
+        with open(source, 'rb') as f:
+            payload = _upload_payload(filename, DocumentProcessor().extract_from_docx(f))
+    except Exception as e:
+        payload = {"error": f"Failed to process document: {str(e)}"}
+
+    with tempfile.NamedTemporaryFile(dir=UPLOAD_JOBS_DIR, suffix=".tmp", delete=False) as f:
+        f.write(orjson.dumps(payload))
+    os.replace(f.name, UPLOAD_JOBS_DIR / f"{job_id}.json")
+    # Removed only once the result exists, so /status never loses the job
+    source.unlink(missing_ok=True)
+
+
+def _prune_upload_jobs():
+    """Delete job files older than UPLOAD_JOB_TTL."""
+    cutoff = time.time() - UPLOAD_JOB_TTL
+    with os.scandir(UPLOAD_JOBS_DIR) as it:
+        for entry in it:
+            # A job can delete its own upload while this runs
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+def _upload_job_done(future):
+    global _upload_pool, _upload_pending
+
+    with _upload_lock:
+        _upload_pending -= 1
+        if future.exception() is not None:
+            logger.error(f"Upload job error: {str(future.exception())}")
+            # The pool may be broken; start a fresh one on the next job
+            _upload_pool = None
+
+
+def _submit_upload_job(file) -> Optional[str]:
+    """Save the upload and queue its extraction; None when too many jobs are pending."""
+    global _upload_pool, _upload_pending
+
+    with _upload_lock:
+        if _upload_pending >= UPLOAD_MAX_PENDING:
+            return None
+        _upload_pending += 1
+
+    try:
+        UPLOAD_JOBS_DIR.mkdir(exist_ok=True)
+        _prune_upload_jobs()
+        job_id = uuid.uuid4().hex
+        file.save(UPLOAD_JOBS_DIR / f"{job_id}.docx")
+        with _upload_lock:
+            if _upload_pool is None:
+                # Created on first use, i.e. in the worker process after any fork
+                _upload_pool = ProcessPoolExecutor(max_workers=UPLOAD_POOL_WORKERS)
+            future = _upload_pool.submit(_run_upload_job, job_id, file.filename)
+    except BaseException:
+        with _upload_lock:
+            _upload_pending -= 1
+        raise
+    future.add_done_callback(_upload_job_done)
+    return job_id
+
+
 @upload_bp.route('', methods=['POST'])
 def upload_document():
     """
@@ -37,53 +204,79 @@ def upload_document():
     Expected form data:
         file: The DOCX file to upload
 
+    Query parameters:
+        async: "1" to extract in the background; responds 202 with a
+            job_id to poll at /status/<job_id>
+
     Returns:
         JSON with extracted content, case info, and detected sections
     """
     try:
         # Check if file was provided
         if 'file' not in request.files:
-            return jsonify({"error": "No file provided"}), 400
+            return _json_response({"error": "No file provided"}, 400)
 
         file = request.files['file']
 
         if file.filename == '':
-            return jsonify({"error": "No file selected"}), 400
+            return _json_response({"error": "No file selected"}, 400)
 
         if not allowed_file(file.filename):
-            return jsonify({
+            return _json_response({
                 "error": "Invalid file type. Only DOCX files are supported."
-            }), 400
-
-        # Read file bytes
-        file_bytes = file.read()
-
-        # Check file size
-        if len(file_bytes) > MAX_FILE_SIZE:
-            return jsonify({
-                "error": f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB."
-            }), 400
-
-        # Process the document
+            }, 400)
+
+        # Reject renamed or truncated files before the full parse
+        if not is_docx(file.stream):
+            return _json_response({
+                "error": "Invalid file. The upload is not a valid DOCX document."
+            }, 400)
+
+        if request.args.get('async') == '1':
+            job_id = _submit_upload_job(file)
+            if job_id is None:
+                return _json_response({"error": "Server busy processing documents, try again shortly"}, 503)
+            return _json_response({"job_id": job_id, "status": "pending"}, 202)
+
+        # Process the document; the upload is already spooled by Werkzeug, so
+        # it is parsed in place rather than read into memory. Oversize uploads
+        # never get here: MAX_CONTENT_LENGTH stops them with a 413.
         processor = DocumentProcessor()
-        content = processor.extract_from_docx(file_bytes)
+        content = processor.extract_from_docx(file.stream)
 
-        return jsonify({
-            "success": True,
-            "filename": file.filename,
-            "extracted": {
-                "full_text": content["full_text"],
-                "paragraphs": content["paragraphs"],
-                "case_info": content["case_info"],
-                "sections": content["sections"],
-                "word_count": content["word_count"],
-                "paragraph_count": content["paragraph_count"]
-            }
-        })
+        return _json_response(_upload_payload(file.filename, content))
 
+    except RequestEntityTooLarge:
+        # Answered by the app's JSON 413 handler
+        raise
     except Exception as e:
         logger.error(f"Upload error: {str(e)}")
-        return jsonify({"error": f"Failed to process document: {str(e)}"}), 500
+        return _json_response({"error": f"Failed to process document: {str(e)}"}, 500)
+
+
+@upload_bp.route('/status/<job_id>', methods=['GET'])
+def upload_status(job_id):
+    """
+    Status of a background upload (see ?async=1).
+
+    Returns:
+        {"status": "pending"} while extracting; once finished, the same JSON
+        as a synchronous upload plus "status": "done", or "status": "failed"
+        with the error (500)
+    """
+    if not UPLOAD_JOB_ID_RE.fullmatch(job_id):
+        return _json_response({"error": "Upload job not found"}, 404)
+
+    try:
+        result = orjson.loads((UPLOAD_JOBS_DIR / f"{job_id}.json").read_bytes())
+    except FileNotFoundError:
+        if (UPLOAD_JOBS_DIR / f"{job_id}.docx").exists():
+            return _json_response({"job_id": job_id, "status": "pending"})
+        return _json_response({"error": "Upload job not found"}, 404)
+
+    if "error" in result:
+        return _json_response({"job_id": job_id, "status": "failed", **result}, 500)
+    return _json_response({"job_id": job_id, "status": "done", **result})
 
 
 @upload_bp.route('/reformat', methods=['POST'])
@@ -105,7 +298,7 @@ def reformat_document():
         data = request.get_json()
 
         if not data:
-            return jsonify({"error": "No data provided"}), 400
+            return _json_response({"error": "No data provided"}, 400)
 
         # Extract required fields
         sections = data.get("sections", {})
@@ -116,9 +309,7 @@ def reformat_document():
 
         # Validate doc_type
         if doc_type not in DOCUMENT_TYPES:
-            return jsonify({
-                "error": f"Invalid document type. Valid types: {', '.join(DOCUMENT_TYPES.keys())}"
-            }), 400
+            return _json_response({"error": INVALID_DOC_TYPE_MSG}, 400)
 
         # Build content dict
         content = {"sections": sections}
@@ -139,17 +330,12 @@ def reformat_document():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{case_clean}_{doc_type}_reformatted_{timestamp}.docx"
 
-        # Return as download
-        return send_file(
-            BytesIO(reformatted_bytes),
-            mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            as_attachment=True,
-            download_name=filename
-        )
+        # Return as download; the bytes go out as-is with a known length
+        return _attachment_response(reformatted_bytes, DOCX_MIMETYPE, filename)
 
     except Exception as e:
         logger.error(f"Reformat error: {str(e)}")
-        return jsonify({"error": f"Failed to reformat document: {str(e)}"}), 500
+        return _json_response({"error": f"Failed to reformat document: {str(e)}"}, 500)
 
 
 @upload_bp.route('/preview', methods=['POST'])
@@ -163,7 +349,7 @@ def preview_document():
         data = request.get_json()
 
         if not data:
-            return jsonify({"error": "No data provided"}), 400
+            return _json_response({"error": "No data provided"}, 400)
 
         sections = data.get("sections", {})
         doc_type = data.get("doc_type", "motion_to_dismiss")
@@ -206,20 +392,12 @@ FOR THE DISTRICT OF COLUMBIA
         })
 
         # Sections preview
-        section_names = {
-            "introduction": "INTRODUCTION",
-            "facts": "FACTUAL BACKGROUND",
-            "legal_standard": "LEGAL STANDARD",
-            "argument": "ARGUMENT",
-            "conclusion": "CONCLUSION"
-        }
-
-        for section_key, section_title in section_names.items():
-            if sections.get(section_key):
-                content = sections[section_key]
+        for section_key, section_title in PREVIEW_SECTIONS:
+            content = sections.get(section_key)
+            if content:
                 # Truncate for preview
-                if len(content) > 500:
-                    content = content[:500] + "..."
+                if len(content) > PREVIEW_SECTION_CHARS:
+                    content = content[:PREVIEW_SECTION_CHARS] + "..."
 
                 preview_parts.append({
                     "type": "section",
@@ -229,20 +407,17 @@ FOR THE DISTRICT OF COLUMBIA
 
         # Signature block preview
         if attorney_info:
-            sig_preview = f"""Respectfully submitted,
-
-/s/ {attorney_info.get('name', 'Attorney Name')}
-{attorney_info.get('name', 'Attorney Name')}"""
-
+            name = attorney_info.get('name', 'Attorney Name')
+            sig_lines = ["Respectfully submitted,", "", f"/s/ {name}", name]
             if attorney_info.get('firm'):
-                sig_preview += f"\n{attorney_info['firm']}"
+                sig_lines.append(attorney_info['firm'])
 
             preview_parts.append({
                 "type": "signature",
-                "content": sig_preview
+                "content": "\n".join(sig_lines)
             })
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "preview": preview_parts,
             "format_info": {
@@ -256,22 +431,10 @@ FOR THE DISTRICT OF COLUMBIA
 
     except Exception as e:
         logger.error(f"Preview error: {str(e)}")
-        return jsonify({"error": f"Failed to generate preview: {str(e)}"}), 500
+        return _json_response({"error": f"Failed to generate preview: {str(e)}"}, 500)
 
 
 @upload_bp.route('/document-types', methods=['GET'])
 def get_document_types():
     """Get list of available document types."""
-    types = []
-    for key, config in DOCUMENT_TYPES.items():
-        types.append({
-            "id": key,
-            "name": config["name"],
-            "title": config["title"],
-            "category": config["category"],
-            "max_pages": config.get("max_pages")
-        })
-
-    return jsonify({
-        "document_types": types
-    })
+    return current_app.response_class(DOCUMENT_TYPES_JSON, mimetype="application/json")
@@ -6,26 +6,84 @@ A local web application for:
 2. Researching cases via CourtListener API
 """
 import os
+import re
 import sys
+import gzip
+import hashlib
+import importlib.util
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from flask import Flask, render_template, jsonify
+import orjson
+from flask import Flask, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from jinja2 import BaseLoader, FileSystemBytecodeCache
 
-from config import Config, OUTPUT_DIR
+from config import Config, OUTPUT_DIR, JINJA_CACHE_DIR
 from api.documents import documents_bp
 from api.research import research_bp
 from api.upload import upload_bp
 
+# Fixed response bodies, serialized once at import
+HEALTH_JSON = orjson.dumps({"status": "ok", "app": "DC Federal Court Document Drafter"})
+NOT_FOUND_JSON = orjson.dumps({"error": "Not found"})
+SERVER_ERROR_JSON = orjson.dumps({"error": "Internal server error"})
+
+# HTML comments (not IE conditionals) and the indentation after each newline;
+# newlines themselves are kept so inline scripts parse the same
+_HTML_COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.S)
+_INDENT_RE = re.compile(r'\n\s+')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Keys are sorted like the default provider's output, and dates and
+    dataclasses are handed to its default() so they serialize the same way.
+    """
+
+    OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+               | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    def dumps(self, obj, **kwargs):
+        option = self.OPTIONS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class MinifyingLoader(BaseLoader):
+    """Wrap a template loader so sources are minified once, when loaded."""
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def get_source(self, environment, template):
+        source, filename, uptodate = self.loader.get_source(environment, template)
+        source = _INDENT_RE.sub('\n', _HTML_COMMENT_RE.sub('', source))
+        return source, filename, uptodate
+
+    def list_templates(self):
+        return self.loader.list_templates()
+
 
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_object(Config)
 
+    # Compiled templates persist across worker restarts
+    JINJA_CACHE_DIR.mkdir(exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+    app.jinja_env.loader = MinifyingLoader(app.jinja_env.loader)
+
     # Enable CORS for API endpoints
     CORS(app)
 
@@ -37,40 +95,85 @@ def create_app():
     app.register_blueprint(research_bp)
     app.register_blueprint(upload_bp)
 
+    @app.after_request
+    def compress_response(response):
+        """Gzip JSON and HTML bodies for clients that accept it."""
+        if (response.direct_passthrough or response.is_streamed
+                or response.status_code != 200
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in app.config['COMPRESS_MIMETYPES']
+                or not request.accept_encodings['gzip']):
+            return response
+
+        data = response.get_data()
+        if len(data) < app.config['COMPRESS_MIN_SIZE']:
+            return response
+
+        response.set_data(gzip.compress(data, app.config['COMPRESS_LEVEL']))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        # The body differs per encoding, so a strong ETag no longer matches it
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    # Pages depend only on the endpoint (for the active nav link), so each
+    # is rendered once per process and then served from memory
+    rendered_pages = {}
+
+    def render_page(template):
+        """Return template as HTML, rendering it only on the first call per endpoint."""
+        key = (template, request.endpoint, request.script_root)
+        cached = rendered_pages.get(key)
+        if cached is None or app.jinja_env.auto_reload:
+            body = render_template(template).encode()
+            cached = rendered_pages[key] = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+
+        body, etag = cached
+        response = app.response_class(body, mimetype='text/html')
+        response.set_etag(etag)
+        return response.make_conditional(request)
+
     # Main routes
     @app.route('/')
     def index():
         """Redirect to generator page."""
-        return render_template('generator.html')
+        return render_page('generator.html')
 
     @app.route('/generator')
     def generator():
         """Document generator page."""
-        return render_template('generator.html')
+        return render_page('generator.html')
 
     @app.route('/research')
     def research():
         """Court research page."""
-        return render_template('research.html')
+        return render_page('research.html')
 
     @app.route('/upload')
     def upload():
         """Document upload and reformat page."""
-        return render_template('upload.html')
+        return render_page('upload.html')
 
     @app.route('/health')
     def health():
         """Health check endpoint."""
-        return jsonify({"status": "ok", "app": "DC Federal Court Document Drafter"})
+        return app.response_class(HEALTH_JSON, mimetype='application/json')
 
     # Error handlers
     @app.errorhandler(404)
     def not_found(e):
-        return jsonify({"error": "Not found"}), 404
+        return app.response_class(NOT_FOUND_JSON, status=404, mimetype='application/json')
+
+    @app.errorhandler(413)
+    def too_large(e):
+        max_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+        return jsonify({"error": f"File too large. Maximum size is {max_mb}MB."}), 413
 
     @app.errorhandler(500)
     def server_error(e):
-        return jsonify({"error": "Internal server error"}), 500
+        return app.response_class(SERVER_ERROR_JSON, status=500, mimetype='application/json')
 
     return app
 
@@ -92,4 +195,15 @@ if __name__ == '__main__':
     print("\nPress Ctrl+C to stop the server")
     print("=" * 60 + "\n")
 
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    if os.name == 'posix' and importlib.util.find_spec('gunicorn'):
+        # Same server as the Procfile: threaded gunicorn workers
+        workers = str(2 * (os.cpu_count() or 1) + 1)
+        os.chdir(Path(__file__).parent)
+        os.execvp(sys.executable, [
+            sys.executable, "-m", "gunicorn", "app:app",
+            "--bind", "0.0.0.0:5000", "--workers", workers,
+            "--worker-class", "gthread", "--threads", "8"
+        ])
+    else:
+        # gunicorn does not run on Windows (or is not installed)
+        app.run(host='0.0.0.0', port=5000, threaded=True)
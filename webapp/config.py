@@ -12,14 +12,14 @@ load_dotenv()
 BASE_DIR = Path(__file__).parent.resolve()
 PROJECT_DIR = BASE_DIR.parent
 OUTPUT_DIR = BASE_DIR / "output"
-
-# Ensure output directory exists
-OUTPUT_DIR.mkdir(exist_ok=True)
+JINJA_CACHE_DIR = BASE_DIR / ".jinja_cache"
 
 # Flask configuration
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
-    DEBUG = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
+    DEBUG = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+    # Templates only change on deploy; skip the per-render mtime check
+    TEMPLATES_AUTO_RELOAD = os.environ.get('TEMPLATES_AUTO_RELOAD', 'False').lower() == 'true'
 
     # CourtListener API
     COURTLISTENER_API_TOKEN = os.environ.get('COURTLISTENER_API_TOKEN', '')
@@ -43,6 +43,11 @@ class Config:
     UPLOAD_ALLOWED_EXTENSIONS = {'docx'}
     UPLOAD_MAX_FILE_SIZE = 16 * 1024 * 1024  # 16MB
 
+    # Response compression (gzip) for JSON and HTML bodies
+    COMPRESS_MIMETYPES = {'application/json', 'text/html'}
+    COMPRESS_MIN_SIZE = 500  # bytes; smaller bodies aren't worth it
+    COMPRESS_LEVEL = 5
+
 # DC District Court specific constants
 DC_COURT_NAME = "UNITED STATES DISTRICT COURT\nFOR THE DISTRICT OF COLUMBIA"
 DC_COURT_ID = "dcd"
@@ -78,6 +83,10 @@ DC_JUDGES = [
     {"initials": "BAH", "name": "Beryl A. Howell (Senior)", "status": "senior"},
 ]
 
+# O(1) judge lookups by initials (as in case numbers) and by display name
+DC_JUDGES_BY_INITIALS = {judge["initials"]: judge for judge in DC_JUDGES}
+DC_JUDGES_BY_NAME = {judge["name"]: judge for judge in DC_JUDGES}
+
 # Document types with their configurations
 DOCUMENT_TYPES = {
     "motion_to_dismiss": {
@@ -8,7 +8,15 @@ dockets, and legal opinions from the DC District Court and DC Circuit.
 API Documentation: https://www.courtlistener.com/help/api/rest/
 """
 import os
+import re
+import time
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from enum import Enum
@@ -30,11 +38,32 @@ DC_JUDGES = [
     "Moss", "McFadden", "Friedrich", "Kelly", "Nichols"
 ]
 
+# "<volume> <reporter> <page>", e.g. "410 U.S. 113"
+_CITATION_RE = re.compile(r'^(\d+)\s+([A-Za-z0-9.\s]+?)\s+(\d+)$')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Threads for running independent API calls side by side; the calls are
+# network-bound, so a bundle only waits for the slowest one
+BUNDLE_WORKERS = 8
+_bundle_pool = ThreadPoolExecutor(max_workers=BUNDLE_WORKERS, thread_name_prefix="courtlistener")
+
+# Kept-alive connections per host, so concurrent requests reuse warm TLS
+# connections instead of handshaking again once the default 10 are in use
+POOL_MAXSIZE = 50
+# Gateway errors and failed connects are retried with backoff before being
+# reported. Read timeouts are not: the request already waited the full timeout,
+# and it must surface as a Timeout (504) rather than a ConnectionError
+RETRY = Retry(total=3, read=False, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+              allowed_methods=("GET",), raise_on_status=False)
+
 
 @dataclass
 class CourtListenerConfig:
     api_token: str
     base_url: str = "https://www.courtlistener.com/api/rest/v4"
+    # Responses are reused for cache_ttl seconds; at most cache_size are kept
+    cache_ttl: int = 300
+    cache_size: int = 1024
 
 
 class CourtListenerClient:
@@ -48,15 +77,48 @@ class CourtListenerClient:
             "Authorization": f"Token {self.api_token}",
             "Accept": "application/json"
         })
+        # requests already sends Accept-Encoding for every codec it can
+        # decode (gzip, deflate; br when brotli is installed)
+        adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE, max_retries=RETRY)
+        self.session.mount("https://", adapter)
+        self.cache_ttl = config.cache_ttl
+        self.cache_size = config.cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def invalidate(self):
+        """Drop all cached responses."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def _request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make an API request."""
         url = f"{self.base_url}{endpoint}"
 
-        # Filter out None values from params
-        if params:
+        # Filter out None values from params, copying only when there are any
+        if params and any(v is None for v in params.values()):
             params = {k: v for k, v in params.items() if v is not None}
 
+        # Identical requests within cache_ttl are answered from the cache
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] > now:
+                self._cache.move_to_end(key)
+                return hit[1]
+
+        data = self._fetch(url, params)
+
+        with self._cache_lock:
+            self._cache[key] = (now + self.cache_ttl, data)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return data
+
+    def _fetch(self, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """GET url and return the parsed JSON body, raising on any failure."""
         try:
             response = self.session.get(url, params=params, timeout=30)
         except requests.exceptions.Timeout:
@@ -91,8 +153,8 @@ class CourtListenerClient:
                 raise Exception(f"CourtListener API error ({response.status_code}): {response.text[:200]}")
 
         try:
-            return response.json()
-        except ValueError as e:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             raise Exception(f"Invalid JSON response from API: {str(e)}")
 
     # Docket Methods
@@ -152,6 +214,27 @@ class CourtListenerClient:
             "page_size": page_size
         })
 
+    def get_docket_bundle(self, docket_id: int, entries_page_size: int = 20,
+                          parties_page_size: int = 50,
+                          attorneys_page_size: int = 20) -> Dict[str, Any]:
+        """
+        Get a docket with the first page of its entries, parties and attorneys.
+
+        The four requests run concurrently, so this takes about as long as
+        the slowest of them instead of their sum.
+        """
+        docket = _bundle_pool.submit(self.get_docket, docket_id)
+        entries = _bundle_pool.submit(self.get_docket_entries, docket_id, page_size=entries_page_size)
+        parties = _bundle_pool.submit(self.get_parties, docket_id, page_size=parties_page_size)
+        attorneys = _bundle_pool.submit(self.get_attorneys, docket_id, page_size=attorneys_page_size)
+
+        return {
+            "docket": docket.result(),
+            "entries": entries.result(),
+            "parties": parties.result(),
+            "attorneys": attorneys.result()
+        }
+
     # Opinion Methods
     def search_opinions(self, **params) -> Dict[str, Any]:
         """
@@ -190,10 +273,9 @@ class CourtListenerClient:
         Look up a citation (e.g., "550 U.S. 544").
         Parses common citation formats and searches.
         """
-        import re
 
         # Try to parse citation format: "550 U.S. 544" -> volume=550, reporter=U.S., page=544
-        match = re.match(r'^(\d+)\s+([A-Za-z0-9.\s]+?)\s+(\d+)$', citation.strip())
+        match = _CITATION_RE.match(citation.strip())
 
         if match:
             volume, reporter, page = match.groups()
@@ -232,22 +314,56 @@ class CourtListenerClient:
                         filed_before: Optional[str] = None,
                         judge: Optional[str] = None) -> Dict[str, Any]:
         """Search DC District Court cases."""
-        search_query = query
-        if judge:
-            search_query = f"{query} judge:{judge}"
+        # Built directly (without None values) rather than through
+        # full_text_search, so no kwargs merge or None-filtering pass is needed
+        params = {
+            "q": f"{query} judge:{judge}" if judge else query,
+            "type": type,
+            "court": DC_COURT_IDS["district"]
+        }
+        if filed_after is not None:
+            params["filed_after"] = filed_after
+        if filed_before is not None:
+            params["filed_before"] = filed_before
 
-        return self.full_text_search(
-            q=search_query,
-            type=type,
-            court=DC_COURT_IDS["district"],
-            filed_after=filed_after,
-            filed_before=filed_before
-        )
+        return self._request("/search/", params)
 
 
 # Helper Functions for Formatting Results
+# Formatted dockets and opinion clusters, keyed by formatter, record ID and
+# the record's date_modified, so a record that changes upstream is
+# re-formatted; least recently used entries are dropped past FORMAT_CACHE_SIZE
+FORMAT_CACHE_SIZE = 512
+_format_cache = OrderedDict()
+_format_cache_lock = threading.Lock()
+
+
+def _cached_format(formatter, record: Dict[str, Any]) -> str:
+    """Return formatter(record), reusing the result for the same record version."""
+    key = (formatter, record.get('id'), record.get('date_modified'))
+    if key[1] is None or key[2] is None:
+        return formatter(record)
+
+    with _format_cache_lock:
+        text = _format_cache.get(key)
+        if text is not None:
+            _format_cache.move_to_end(key)
+            return text
+
+    text = formatter(record)
+    with _format_cache_lock:
+        _format_cache[key] = text
+        if len(_format_cache) > FORMAT_CACHE_SIZE:
+            _format_cache.popitem(last=False)
+    return text
+
+
 def format_docket(docket: Dict[str, Any]) -> str:
     """Format a docket for display."""
+    return _cached_format(_format_docket, docket)
+
+
+def _format_docket(docket: Dict[str, Any]) -> str:
     lines = [
         f"**{docket.get('case_name', 'Unknown')}**",
         f"Case No: {docket.get('docket_number', 'N/A')}",
@@ -270,6 +386,10 @@ def format_docket(docket: Dict[str, Any]) -> str:
 
 def format_opinion_cluster(cluster: Dict[str, Any]) -> str:
     """Format an opinion cluster for display."""
+    return _cached_format(_format_opinion_cluster, cluster)
+
+
+def _format_opinion_cluster(cluster: Dict[str, Any]) -> str:
     lines = [
         f"**{cluster.get('case_name', 'Unknown')}**",
         f"Date: {cluster.get('date_filed', 'N/A')}",
@@ -316,8 +436,7 @@ def format_search_result(result: Dict[str, Any]) -> str:
 
     if result.get('snippet'):
         # Remove HTML tags from snippet
-        import re
-        snippet = re.sub(r'<[^>]+>', '', result['snippet'])
+        snippet = _HTML_TAG_RE.sub('', result['snippet'])
         lines.extend(["", "Snippet:", snippet])
 
     lines.append(f"URL: https://www.courtlistener.com{result.get('absolute_url', '')}")
@@ -327,33 +446,29 @@ def format_search_result(result: Dict[str, Any]) -> str:
 
 def format_docket_entries(entries: List[Dict[str, Any]]) -> str:
     """Format docket entries for display."""
-    formatted = []
-    for entry in entries:
-        doc_count = len(entry.get('recap_documents', []))
-        date_str = entry.get('date_filed', 'No date')
-        num_str = f"#{entry['entry_number']}" if entry.get('entry_number') else ""
-        formatted.append(f"{num_str} {date_str}: {entry.get('description', 'N/A')} ({doc_count} doc{'s' if doc_count != 1 else ''})")
-    return "\n".join(formatted)
+    return "\n".join(
+        f"{'#' + str(entry['entry_number']) if entry.get('entry_number') else ''} "
+        f"{entry.get('date_filed', 'No date')}: {entry.get('description', 'N/A')} "
+        f"({(doc_count := len(entry.get('recap_documents', ())))} doc{'s' if doc_count != 1 else ''})"
+        for entry in entries
+    )
 
 
 def format_parties(parties: List[Dict[str, Any]]) -> str:
     """Format parties for display."""
     grouped: Dict[str, List] = {}
-
     for party in parties:
-        party_type = party.get('type_name', 'Unknown')
-        if party_type not in grouped:
-            grouped[party_type] = []
-        grouped[party_type].append(party)
+        grouped.setdefault(party.get('type_name', 'Unknown'), []).append(party)
 
     lines = []
+    append = lines.append
     for party_type, type_parties in grouped.items():
-        lines.append(f"**{party_type}:**")
+        append(f"**{party_type}:**")
         for party in type_parties:
-            lines.append(f"  - {party.get('name', 'Unknown')}")
-            for atty in party.get('attorneys', []):
-                lines.append(f"    Attorney: {atty.get('name', 'Unknown')}")
+            append(f"  - {party.get('name', 'Unknown')}")
+            for atty in party.get('attorneys', ()):
+                append(f"    Attorney: {atty.get('name', 'Unknown')}")
                 if atty.get('email'):
-                    lines.append(f"    Email: {atty['email']}")
+                    append(f"    Email: {atty['email']}")
 
     return "\n".join(lines)
@@ -6,6 +6,11 @@ Implements LCvR 5.1 and LCvR 7 requirements.
 """
 import os
 import re
+import functools
+from copy import deepcopy
+import tempfile
+import uuid
+from string import ascii_uppercase
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -15,26 +20,287 @@ from docx import Document
 from docx.shared import Pt, Inches, Twips
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.section import WD_ORIENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import parse_xml
+from lxml import etree
 
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import FORMAT_SPECS, DC_COURT_NAME, DOCUMENT_TYPES
 
+# Formatting values used on every run, resolved once
+_FONT_NAME = FORMAT_SPECS["font_name"]
+_FONT_SIZE_PT = Pt(FORMAT_SPECS["font_size"])
+_MARGIN = Inches(FORMAT_SPECS["margin_inches"])
+
+# Characters replaced with "_" when a case number is used in a filename
+_FILENAME_SANITIZE_RE = re.compile(r'[^\w\-]')
+
+# Body sections ahead of the additional arguments, in document order, with
+# their headings; the introduction (no heading) opens with the party's motion
+_LEADING_SECTIONS = (
+    ("introduction", None),
+    ("facts", "FACTUAL BACKGROUND"),
+    ("legal_standard", "LEGAL STANDARD"),
+    ("argument", "ARGUMENT"),
+)
+
+# Optional attorney fields in signature-block order, with their line format
+_ATTORNEY_FIELDS = (
+    ("firm", "{}"),
+    ("address", "{}"),
+    ("city_state_zip", "{}"),
+    ("phone", "Tel: {}"),
+    ("email", "Email: {}"),
+    ("dc_bar_number", "DC Bar No. {}"),
+)
+
+# Caption layouts, filled in with str.format
+_PARTIES_TEMPLATE = """\
+________________________________________
+                                        )
+{plaintiff},
+                                        )
+               Plaintiff,               )
+                                        )
+          v.                            )
+                                        )
+{defendant},
+                                        )
+               Defendant.               )
+________________________________________)"""
+
+_CASE_INFO_TEMPLATE = "\n\n\n\nCase No. {case_display}\n\n\n"
+
+_PDF_CAPTION_TEMPLATE = """\
+________________________________________
+                                        )
+{plaintiff},                           )
+                                        )
+               Plaintiff,               )    Case No. {case_display}
+                                        )
+          v.                            )
+                                        )
+{defendant},                           )
+                                        )
+               Defendant.               )
+________________________________________)   {judge_line}"""
+
+
+def _apply_font(run):
+    """Set the document font and size on a run or style."""
+    font = run.font
+    font.name = _FONT_NAME
+    font.size = _FONT_SIZE_PT
+
+
+# Run properties for the document font, copied into runs added through
+# python-docx instead of setting font.name and font.size on each one
+_RUN_FONT_RPR = parse_xml(
+    f'<w:rPr {nsdecls("w")}><w:rFonts w:ascii="{_FONT_NAME}" w:hAnsi="{_FONT_NAME}"/>'
+    f'<w:sz w:val="{round(_FONT_SIZE_PT.pt * 2)}"/></w:rPr>'
+)
+
+
+# Footer run holding a PAGE field, in the document font
+_PAGE_NUMBER_RUN = parse_xml(
+    f'<w:r {nsdecls("w")}><w:rPr><w:rFonts w:ascii="{_FONT_NAME}" w:hAnsi="{_FONT_NAME}"/>'
+    f'<w:sz w:val="{round(_FONT_SIZE_PT.pt * 2)}"/></w:rPr>'
+    f'<w:fldChar w:fldCharType="begin"/><w:instrText>PAGE</w:instrText>'
+    f'<w:fldChar w:fldCharType="end"/></w:r>'
+)
+
+
+def _add_font_run(paragraph, text: Optional[str] = None):
+    """Add a run in the document font to a python-docx paragraph."""
+    run = paragraph.add_run(text)
+    run._r.insert(0, deepcopy(_RUN_FONT_RPR))
+    return run
+
+
+def _attorney_contact_lines(attorney: dict) -> list:
+    """Signature-block lines for the attorney fields that are filled in."""
+    return [fmt.format(value) for key, fmt in _ATTORNEY_FIELDS if (value := attorney.get(key))]
+
+
+def _with_date(data: dict) -> dict:
+    """data with "date" filled in with today's date if the caller left it out."""
+    if "date" in data:
+        return data
+    return {**data, "date": datetime.now().strftime("%B %d, %Y")}
+
+
+def _paragraph_template(align: str, bold: bool = False, double: bool = False,
+                        first_line_indent: Optional[int] = None):
+    """Build a <w:p> with one empty run in the document font, to copy from."""
+    spacing = '<w:spacing w:line="480" w:lineRule="auto"/>' if double else ''
+    indent = f'<w:ind w:firstLine="{first_line_indent}"/>' if first_line_indent else ''
+    return parse_xml(
+        f'<w:p {nsdecls("w")}>'
+        f'<w:pPr>{spacing}{indent}<w:jc w:val="{align}"/></w:pPr>'
+        f'<w:r><w:rPr><w:rFonts w:ascii="{_FONT_NAME}" w:hAnsi="{_FONT_NAME}"/>'
+        f'{"<w:b/>" if bold else ""}<w:sz w:val="{round(_FONT_SIZE_PT.pt * 2)}"/></w:rPr></w:r>'
+        f'</w:p>'
+    )
+
+
+# Single-run paragraph shapes used throughout the document. Copying a
+# prebuilt element is several times cheaper than add_paragraph/add_run and
+# setting alignment, spacing and font through python-docx's proxies.
+_CENTERED_BOLD_P = _paragraph_template("center", bold=True)
+_LEFT_BOLD_P = _paragraph_template("left", bold=True)
+_BODY_P = _paragraph_template("both", double=True)
+_INDENTED_BODY_P = _paragraph_template("both", double=True, first_line_indent=Inches(0.5).twips)
+_RIGHT_P = _paragraph_template("right")
+
+
+# Run text is split on tabs and line breaks, which become their own elements
+_RUN_BREAK_RE = re.compile(r'([\t\r\n])')
+_W_T, _W_BR, _W_TAB = qn('w:t'), qn('w:br'), qn('w:tab')
+_XML_SPACE = qn('xml:space')
+
+
+def _set_run_text(r, text: str):
+    """
+    Fill an empty <w:r> with text, as add_run(text) would.
+
+    Produces the same <w:t>/<w:br/>/<w:tab/> elements as python-docx, which
+    builds them one character at a time; for a long caption or brief
+    section that dominates the cost of the paragraph.
+    """
+    for piece in _RUN_BREAK_RE.split(text):
+        if piece == '\t':
+            etree.SubElement(r, _W_TAB)
+        elif piece == '\n' or piece == '\r':
+            etree.SubElement(r, _W_BR)
+        elif piece:
+            t = etree.SubElement(r, _W_T)
+            t.text = piece
+            if len(piece.strip()) < len(piece):
+                t.set(_XML_SPACE, 'preserve')
+
+
+def _add_fast_paragraph(doc: Document, template, text: str):
+    """Append a copy of template to the document body with text in its run."""
+    p = deepcopy(template)
+    _set_run_text(p[-1], text)
+    doc.element.body._insert_p(p)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_title(doc_type: str, motion_type: str) -> str:
+    """Title for a document type, with the motion type filled in if it takes one."""
+    title = DOCUMENT_TYPES.get(doc_type, DOCUMENT_TYPES["motion_to_dismiss"])["title"]
+
+    # Handle placeholders for opposition/reply
+    if "{motion_type}" in title:
+        title = title.replace("{motion_type}", motion_type)
+    return title
+
+
+def _document_title(data: dict) -> str:
+    """The document's title; a custom title, if provided, replaces the standard one."""
+    custom_title = data.get("custom_title", "")
+    if custom_title:
+        return custom_title.upper()
+    return _resolve_title(
+        data.get("document_type", "motion_to_dismiss"),
+        data.get("motion_type", "DEFENDANT'S MOTION TO DISMISS"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _pdf_styles() -> dict:
+    """Paragraph styles for PDF output, built on first use and shared."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+
+    styles = getSampleStyleSheet()
+
+    # Court header style
+    court_style = ParagraphStyle(
+        'CourtHeader',
+        parent=styles['Normal'],
+        fontName='Times-Roman',
+        fontSize=12,
+        alignment=TA_CENTER,
+        spaceAfter=12,
+        leading=14
+    )
+
+    # Title style
+    title_style = ParagraphStyle(
+        'Title',
+        parent=styles['Normal'],
+        fontName='Times-Bold',
+        fontSize=12,
+        alignment=TA_CENTER,
+        spaceAfter=24,
+        spaceBefore=12
+    )
+
+    # Heading style
+    heading_style = ParagraphStyle(
+        'Heading',
+        parent=styles['Normal'],
+        fontName='Times-Bold',
+        fontSize=12,
+        alignment=TA_CENTER,
+        spaceAfter=12,
+        spaceBefore=24
+    )
+
+    # Body style (double-spaced)
+    body_style = ParagraphStyle(
+        'Body',
+        parent=styles['Normal'],
+        fontName='Times-Roman',
+        fontSize=12,
+        alignment=TA_JUSTIFY,
+        leading=24,  # Double spacing
+        firstLineIndent=36,
+        spaceAfter=0
+    )
+
+    # Caption style (single-spaced)
+    caption_style = ParagraphStyle(
+        'Caption',
+        parent=styles['Normal'],
+        fontName='Courier',
+        fontSize=10,
+        alignment=TA_LEFT,
+        leading=12,
+        spaceAfter=12
+    )
+
+    # Signature style
+    sig_style = ParagraphStyle(
+        'Signature',
+        parent=styles['Normal'],
+        fontName='Times-Roman',
+        fontSize=12,
+        alignment=TA_LEFT,
+        leading=14,
+        leftIndent=216  # 3 inches from left
+    )
+
+    return {
+        "court": court_style,
+        "title": title_style,
+        "heading": heading_style,
+        "body": body_style,
+        "caption": caption_style,
+        "signature": sig_style,
+    }
+
 
 class DocumentGenerator:
     """Generates court documents in DOCX and PDF formats."""
 
+    # Empty caption table copied into each document; see _add_caption
+    _caption_table = None
+
     def __init__(self, output_dir: str):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def generate(self, data: dict, format: str = "docx") -> tuple[str, bytes]:
         """
@@ -54,8 +320,59 @@ class DocumentGenerator:
         else:
             raise ValueError(f"Unsupported format: {format}")
 
+    def generate_to_file(self, data: dict, format: str = "docx") -> tuple[str, Path]:
+        """
+        Generate a court document directly into output_dir.
+
+        The file is written under a temporary name and renamed into place, so
+        a reader never sees a partial document. The path on disk is unique to
+        this call; the timestamped filename is only for the download, since
+        two requests in the same second can share it.
+
+        Args:
+            data: Document data including case info, content, etc.
+            format: Output format ("docx" or "pdf")
+
+        Returns:
+            Tuple of (download filename, path)
+        """
+        extension = format.lower()
+        if extension == "docx":
+            write = self._write_docx
+        elif extension == "pdf":
+            write = self._write_pdf
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+
+        filename = self._generate_filename(data, extension)
+        path = self.output_dir / f"{uuid.uuid4().hex}.{extension}"
+
+        with tempfile.NamedTemporaryFile(dir=self.output_dir, suffix=".tmp", delete=False) as tmp:
+            try:
+                write(data, tmp)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        os.replace(tmp.name, path)
+
+        return filename, path
+
+    def filename_for(self, data: dict, format: str = "docx") -> str:
+        """Download filename for a document generated from data."""
+        return self._generate_filename(data, format.lower())
+
     def _generate_docx(self, data: dict) -> tuple[str, bytes]:
         """Generate a DOCX document with proper formatting."""
+        filename = self._generate_filename(data, "docx")
+        buffer = BytesIO()
+        self._write_docx(data, buffer)
+
+        return filename, buffer.getvalue()
+
+    def _write_docx(self, data: dict, target) -> None:
+        """Build the DOCX document and save it to target (path or binary file)."""
+        data = _with_date(data)
         doc = Document()
 
         # Set up document formatting
@@ -80,13 +397,7 @@ class DocumentGenerator:
         # Add page numbers
         self._add_page_numbers(doc)
 
-        # Save to bytes
-        filename = self._generate_filename(data, "docx")
-        buffer = BytesIO()
-        doc.save(buffer)
-        buffer.seek(0)
-
-        return filename, buffer.getvalue()
+        doc.save(target)
 
     def _setup_document_format(self, doc: Document):
         """Set up document formatting per LCvR 7(o)(1)."""
@@ -98,16 +409,14 @@ class DocumentGenerator:
         section.page_height = Inches(11)
 
         # Set margins to 1 inch
-        section.top_margin = Inches(FORMAT_SPECS["margin_inches"])
-        section.bottom_margin = Inches(FORMAT_SPECS["margin_inches"])
-        section.left_margin = Inches(FORMAT_SPECS["margin_inches"])
-        section.right_margin = Inches(FORMAT_SPECS["margin_inches"])
+        section.top_margin = _MARGIN
+        section.bottom_margin = _MARGIN
+        section.left_margin = _MARGIN
+        section.right_margin = _MARGIN
 
         # Set default font
         style = doc.styles['Normal']
-        font = style.font
-        font.name = FORMAT_SPECS["font_name"]
-        font.size = Pt(FORMAT_SPECS["font_size"])
+        _apply_font(style)
 
         # Set line spacing to double
         paragraph_format = style.paragraph_format
@@ -116,17 +425,30 @@ class DocumentGenerator:
     def _add_caption(self, doc: Document, data: dict):
         """Add the caption block per LCvR 5.1(b)(c)."""
         # Court name - centered, bold
-        court_para = doc.add_paragraph()
-        court_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        court_run = court_para.add_run(DC_COURT_NAME)
-        court_run.bold = True
-        court_run.font.name = FORMAT_SPECS["font_name"]
-        court_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _add_fast_paragraph(doc, _CENTERED_BOLD_P, DC_COURT_NAME)
 
         # Add spacing
         doc.add_paragraph()
 
-        # Create the caption box with parties and case number
+        # Create the caption box with parties and case number. The table is
+        # built through python-docx once, then later documents get a copy
+        cls = type(self)
+        if cls._caption_table is None:
+            cls._caption_table = deepcopy(self._add_caption_table(doc))
+        else:
+            doc.element.body._insert_tbl(deepcopy(cls._caption_table))
+        tbl = doc.element.body.tbl_lst[-1]
+        left_run, right_run = tbl.iter(qn('w:r'))
+
+        # Left side content (parties), right side (case number, judge)
+        _set_run_text(left_run, self._build_parties_block(data))
+        _set_run_text(right_run, self._build_case_info_block(data))
+
+        # Add spacing after caption
+        doc.add_paragraph()
+
+    def _add_caption_table(self, doc: Document):
+        """Add the two-column caption table, with an empty run in each cell."""
         # Using a table for layout
         table = doc.add_table(rows=1, cols=2)
         table.autofit = False
@@ -136,51 +458,21 @@ class DocumentGenerator:
         table.columns[0].width = Inches(3.5)
         table.columns[1].width = Inches(2.5)
 
-        left_cell = table.rows[0].cells[0]
-        right_cell = table.rows[0].cells[1]
+        for cell in table.rows[0].cells:
+            para = cell.paragraphs[0]
+            para.alignment = WD_ALIGN_PARAGRAPH.LEFT
+            _add_font_run(para)
+            # Single spacing for caption
+            para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
 
-        # Build left side content (parties)
-        parties_text = self._build_parties_block(data)
-        left_para = left_cell.paragraphs[0]
-        left_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        left_run = left_para.add_run(parties_text)
-        left_run.font.name = FORMAT_SPECS["font_name"]
-        left_run.font.size = Pt(FORMAT_SPECS["font_size"])
-        # Single spacing for caption
-        left_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-
-        # Build right side content (case number, judge)
-        right_text = self._build_case_info_block(data)
-        right_para = right_cell.paragraphs[0]
-        right_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        right_run = right_para.add_run(right_text)
-        right_run.font.name = FORMAT_SPECS["font_name"]
-        right_run.font.size = Pt(FORMAT_SPECS["font_size"])
-        right_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-
-        # Add spacing after caption
-        doc.add_paragraph()
+        return table._tbl
 
     def _build_parties_block(self, data: dict) -> str:
         """Build the parties portion of the caption."""
-        plaintiff = data.get("plaintiff", "PLAINTIFF NAME")
-        defendant = data.get("defendant", "DEFENDANT NAME")
-
-        lines = [
-            "________________________________________",
-            "                                        )",
-            f"{plaintiff.upper()},",
-            "                                        )",
-            "               Plaintiff,               )",
-            "                                        )",
-            "          v.                            )",
-            "                                        )",
-            f"{defendant.upper()},",
-            "                                        )",
-            "               Defendant.               )",
-            "________________________________________)",
-        ]
-        return "\n".join(lines)
+        return _PARTIES_TEMPLATE.format(
+            plaintiff=data.get("plaintiff", "PLAINTIFF NAME").upper(),
+            defendant=data.get("defendant", "DEFENDANT NAME").upper()
+        )
 
     def _build_case_info_block(self, data: dict) -> str:
         """Build the case information portion of the caption."""
@@ -190,44 +482,14 @@ class DocumentGenerator:
         # Use placeholder if case number not provided
         case_display = case_number if case_number else "[Case No. TBD]"
 
-        lines = [
-            "",
-            "",
-            "",
-            "",
-            f"Case No. {case_display}",
-            "",
-            "",
-            "",
-        ]
+        text = _CASE_INFO_TEMPLATE.format(case_display=case_display)
         if judge_name:
-            lines.append(f"Judge: {judge_name}")
-
-        return "\n".join(lines)
+            text += f"\nJudge: {judge_name}"
+        return text
 
     def _add_document_title(self, doc: Document, data: dict):
         """Add the document title."""
-        doc_type = data.get("document_type", "motion_to_dismiss")
-        doc_config = DOCUMENT_TYPES.get(doc_type, DOCUMENT_TYPES["motion_to_dismiss"])
-
-        title = doc_config["title"]
-
-        # Handle placeholders for opposition/reply
-        if "{motion_type}" in title:
-            motion_type = data.get("motion_type", "DEFENDANT'S MOTION TO DISMISS")
-            title = title.replace("{motion_type}", motion_type)
-
-        # Add custom title if provided
-        custom_title = data.get("custom_title", "")
-        if custom_title:
-            title = custom_title.upper()
-
-        title_para = doc.add_paragraph()
-        title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_run = title_para.add_run(title)
-        title_run.bold = True
-        title_run.font.name = FORMAT_SPECS["font_name"]
-        title_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _add_fast_paragraph(doc, _CENTERED_BOLD_P, _document_title(data))
 
         # Add spacing
         doc.add_paragraph()
@@ -236,28 +498,21 @@ class DocumentGenerator:
         """Add the document body content."""
         sections = data.get("sections", {})
 
-        # Introduction
-        if sections.get("introduction"):
-            self._add_section(doc, None, sections["introduction"], is_intro=True, data=data)
-
-        # Background/Facts
-        if sections.get("facts"):
-            self._add_section(doc, "FACTUAL BACKGROUND", sections["facts"])
-
-        # Legal Standard
-        if sections.get("legal_standard"):
-            self._add_section(doc, "LEGAL STANDARD", sections["legal_standard"])
-
-        # Argument
-        if sections.get("argument"):
-            self._add_section(doc, "ARGUMENT", sections["argument"])
+        # Introduction, background, legal standard and argument
+        for key, heading in _LEADING_SECTIONS:
+            content = sections.get(key)
+            if content:
+                if heading is None:
+                    self._add_section(doc, None, content, is_intro=True, data=data)
+                else:
+                    self._add_section(doc, heading, content)
 
         # Additional arguments (A, B, C, etc.)
         for i, arg in enumerate(sections.get("additional_arguments", [])):
-            letter = chr(65 + i)  # A, B, C, ...
-            heading = arg.get("heading", f"Argument {letter}")
-            content = arg.get("content", "")
-            self._add_subsection(doc, f"{letter}. {heading}", content)
+            # A, B, C, ...; numbered past Z
+            label = ascii_uppercase[i] if i < len(ascii_uppercase) else str(i + 1)
+            heading = arg.get("heading", f"Argument {label}")
+            self._add_subsection(doc, f"{label}. {heading}", arg.get("content", ""))
 
         # Conclusion
         if sections.get("conclusion"):
@@ -266,57 +521,32 @@ class DocumentGenerator:
     def _add_section(self, doc: Document, heading: Optional[str], content: str, is_intro: bool = False, data: dict = None):
         """Add a section with heading and content."""
         if heading:
-            heading_para = doc.add_paragraph()
-            heading_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            heading_run = heading_para.add_run(heading)
-            heading_run.bold = True
-            heading_run.font.name = FORMAT_SPECS["font_name"]
-            heading_run.font.size = Pt(FORMAT_SPECS["font_size"])
+            _add_fast_paragraph(doc, _CENTERED_BOLD_P, heading)
 
         # Add introductory language for motions
         if is_intro and data:
             party_name = data.get("party_name", data.get("plaintiff", "Plaintiff"))
             intro_text = f"{party_name}, by and through undersigned counsel, respectfully moves this Court as follows:"
-            intro_para = doc.add_paragraph()
-            intro_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-            intro_run = intro_para.add_run(intro_text)
-            intro_run.font.name = FORMAT_SPECS["font_name"]
-            intro_run.font.size = Pt(FORMAT_SPECS["font_size"])
-            intro_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
+            _add_fast_paragraph(doc, _BODY_P, intro_text)
             doc.add_paragraph()
 
         # Add content paragraphs
-        content_para = doc.add_paragraph()
-        content_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        content_run = content_para.add_run(content)
-        content_run.font.name = FORMAT_SPECS["font_name"]
-        content_run.font.size = Pt(FORMAT_SPECS["font_size"])
-        content_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
+        _add_fast_paragraph(doc, _BODY_P, content)
 
     def _add_subsection(self, doc: Document, heading: str, content: str):
         """Add a subsection (A., B., etc.)."""
-        heading_para = doc.add_paragraph()
-        heading_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        heading_run = heading_para.add_run(heading)
-        heading_run.bold = True
-        heading_run.font.name = FORMAT_SPECS["font_name"]
-        heading_run.font.size = Pt(FORMAT_SPECS["font_size"])
-
-        content_para = doc.add_paragraph()
-        content_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        content_run = content_para.add_run(content)
-        content_run.font.name = FORMAT_SPECS["font_name"]
-        content_run.font.size = Pt(FORMAT_SPECS["font_size"])
-        content_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
+        _add_fast_paragraph(doc, _LEFT_BOLD_P, heading)
+        _add_fast_paragraph(doc, _BODY_P, content)
 
     def _add_signature_block(self, doc: Document, data: dict):
         """Add signature block per LCvR 5.1(d)."""
         attorney = data.get("attorney", {})
+        attorney_name = attorney.get('name', 'Attorney Name')
 
         doc.add_paragraph()  # Spacing
 
         # Date line
-        date_str = data.get("date", datetime.now().strftime("%B %d, %Y"))
+        date_str = data["date"]
 
         # Create two-column layout for date and signature
         table = doc.add_table(rows=1, cols=2)
@@ -333,38 +563,20 @@ class DocumentGenerator:
         sig_lines = [
             "Respectfully submitted,",
             "",
-            f"/s/ {attorney.get('name', 'Attorney Name')}",
-            attorney.get('name', 'Attorney Name'),
+            f"/s/ {attorney_name}",
+            attorney_name,
         ]
-
-        if attorney.get('firm'):
-            sig_lines.append(attorney['firm'])
-
-        if attorney.get('address'):
-            sig_lines.append(attorney['address'])
-
-        if attorney.get('city_state_zip'):
-            sig_lines.append(attorney['city_state_zip'])
-
-        if attorney.get('phone'):
-            sig_lines.append(f"Tel: {attorney['phone']}")
-
-        if attorney.get('email'):
-            sig_lines.append(f"Email: {attorney['email']}")
-
-        if attorney.get('dc_bar_number'):
-            sig_lines.append(f"DC Bar No. {attorney['dc_bar_number']}")
+        sig_lines.extend(_attorney_contact_lines(attorney))
 
         party_represented = data.get("party_represented", "Plaintiff")
         sig_lines.append("")
         sig_lines.append(f"Counsel for {party_represented}")
 
+        # One run for the whole block; python-docx turns each "\n" into a
+        # line break, so this renders the same as a run per line
         sig_para = right_cell.paragraphs[0]
         sig_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        for line in sig_lines:
-            run = sig_para.add_run(line + "\n")
-            run.font.name = FORMAT_SPECS["font_name"]
-            run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _add_font_run(sig_para, "\n".join(sig_lines) + "\n")
         sig_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
 
     def _add_certificate_of_service(self, doc: Document, data: dict):
@@ -372,44 +584,25 @@ class DocumentGenerator:
         doc.add_page_break()
 
         # Title
-        title_para = doc.add_paragraph()
-        title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_run = title_para.add_run("CERTIFICATE OF SERVICE")
-        title_run.bold = True
-        title_run.font.name = FORMAT_SPECS["font_name"]
-        title_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _add_fast_paragraph(doc, _CENTERED_BOLD_P, "CERTIFICATE OF SERVICE")
 
         doc.add_paragraph()
 
         # Certificate text
-        date_str = data.get("date", datetime.now().strftime("%B %d, %Y"))
+        date_str = data["date"]
         doc_title = data.get("custom_title", "foregoing document")
 
         cert_text = f"I hereby certify that on {date_str}, a copy of the {doc_title} was served via the Court's CM/ECF system on all counsel of record."
 
-        cert_para = doc.add_paragraph()
-        cert_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        cert_run = cert_para.add_run(cert_text)
-        cert_run.font.name = FORMAT_SPECS["font_name"]
-        cert_run.font.size = Pt(FORMAT_SPECS["font_size"])
-        cert_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
-        cert_para.paragraph_format.first_line_indent = Inches(0.5)
+        _add_fast_paragraph(doc, _INDENTED_BODY_P, cert_text)
 
         doc.add_paragraph()
         doc.add_paragraph()
 
         # Signature
         attorney = data.get("attorney", {})
-        sig_para = doc.add_paragraph()
-        sig_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        sig_lines = [
-            f"/s/ {attorney.get('name', 'Attorney Name')}",
-            attorney.get('name', 'Attorney Name'),
-        ]
-        for line in sig_lines:
-            run = sig_para.add_run(line + "\n")
-            run.font.name = FORMAT_SPECS["font_name"]
-            run.font.size = Pt(FORMAT_SPECS["font_size"])
+        attorney_name = attorney.get('name', 'Attorney Name')
+        _add_fast_paragraph(doc, _RIGHT_P, f"/s/ {attorney_name}\n{attorney_name}\n")
 
     def _add_page_numbers(self, doc: Document):
         """Add page numbers to the footer (bottom center)."""
@@ -422,28 +615,13 @@ class DocumentGenerator:
         footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
         # Add page number field
-        run = footer_para.add_run()
-        fldChar1 = OxmlElement('w:fldChar')
-        fldChar1.set(qn('w:fldCharType'), 'begin')
-
-        instrText = OxmlElement('w:instrText')
-        instrText.text = "PAGE"
-
-        fldChar2 = OxmlElement('w:fldChar')
-        fldChar2.set(qn('w:fldCharType'), 'end')
-
-        run._r.append(fldChar1)
-        run._r.append(instrText)
-        run._r.append(fldChar2)
-
-        run.font.name = FORMAT_SPECS["font_name"]
-        run.font.size = Pt(FORMAT_SPECS["font_size"])
+        footer_para._p.append(deepcopy(_PAGE_NUMBER_RUN))
 
     def _generate_filename(self, data: dict, extension: str) -> str:
         """Generate a filename for the document."""
         case_number = data.get("case_number", "")
         # Use 'draft' if no case number provided
-        case_clean = re.sub(r'[^\w\-]', '_', case_number) if case_number else "draft"
+        case_clean = _FILENAME_SANITIZE_RE.sub('_', case_number) if case_number else "draft"
 
         doc_type = data.get("document_type", "document")
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -453,9 +631,23 @@ class DocumentGenerator:
     def _generate_pdf(self, data: dict) -> tuple[str, bytes]:
         """Generate a text-searchable PDF document."""
         buffer = BytesIO()
+        self._write_pdf(data, buffer)
+        filename = self._generate_filename(data, "pdf")
+
+        return filename, buffer.getvalue()
+
+    def _write_pdf(self, data: dict, target) -> None:
+        """Build the text-searchable PDF and write it to target (path or binary file)."""
+        data = _with_date(data)
+
+        # reportlab takes ~60 ms to import, so only processes that actually
+        # produce PDFs load it
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 
         doc = SimpleDocTemplate(
-            buffer,
+            target,
             pagesize=letter,
             rightMargin=inch,
             leftMargin=inch,
@@ -463,75 +655,13 @@ class DocumentGenerator:
             bottomMargin=inch
         )
 
-        # Create styles
-        styles = getSampleStyleSheet()
-
-        # Court header style
-        court_style = ParagraphStyle(
-            'CourtHeader',
-            parent=styles['Normal'],
-            fontName='Times-Roman',
-            fontSize=12,
-            alignment=TA_CENTER,
-            spaceAfter=12,
-            leading=14
-        )
-
-        # Title style
-        title_style = ParagraphStyle(
-            'Title',
-            parent=styles['Normal'],
-            fontName='Times-Bold',
-            fontSize=12,
-            alignment=TA_CENTER,
-            spaceAfter=24,
-            spaceBefore=12
-        )
-
-        # Heading style
-        heading_style = ParagraphStyle(
-            'Heading',
-            parent=styles['Normal'],
-            fontName='Times-Bold',
-            fontSize=12,
-            alignment=TA_CENTER,
-            spaceAfter=12,
-            spaceBefore=24
-        )
-
-        # Body style (double-spaced)
-        body_style = ParagraphStyle(
-            'Body',
-            parent=styles['Normal'],
-            fontName='Times-Roman',
-            fontSize=12,
-            alignment=TA_JUSTIFY,
-            leading=24,  # Double spacing
-            firstLineIndent=36,
-            spaceAfter=0
-        )
-
-        # Caption style (single-spaced)
-        caption_style = ParagraphStyle(
-            'Caption',
-            parent=styles['Normal'],
-            fontName='Courier',
-            fontSize=10,
-            alignment=TA_LEFT,
-            leading=12,
-            spaceAfter=12
-        )
-
-        # Signature style
-        sig_style = ParagraphStyle(
-            'Signature',
-            parent=styles['Normal'],
-            fontName='Times-Roman',
-            fontSize=12,
-            alignment=TA_LEFT,
-            leading=14,
-            leftIndent=216  # 3 inches from left
-        )
+        styles = _pdf_styles()
+        court_style = styles["court"]
+        title_style = styles["title"]
+        heading_style = styles["heading"]
+        body_style = styles["body"]
+        caption_style = styles["caption"]
+        sig_style = styles["signature"]
 
         story = []
 
@@ -546,17 +676,7 @@ class DocumentGenerator:
         story.append(Spacer(1, 12))
 
         # Document title
-        doc_type = data.get("document_type", "motion_to_dismiss")
-        doc_config = DOCUMENT_TYPES.get(doc_type, DOCUMENT_TYPES["motion_to_dismiss"])
-        title = doc_config["title"]
-        if "{motion_type}" in title:
-            motion_type = data.get("motion_type", "DEFENDANT'S MOTION TO DISMISS")
-            title = title.replace("{motion_type}", motion_type)
-        custom_title = data.get("custom_title", "")
-        if custom_title:
-            title = custom_title.upper()
-
-        story.append(Paragraph(f"<b>{title}</b>", title_style))
+        story.append(Paragraph(f"<b>{_document_title(data)}</b>", title_style))
 
         # Sections
         sections = data.get("sections", {})
@@ -598,22 +718,18 @@ class DocumentGenerator:
         if data.get("include_certificate_of_service", True):
             story.append(PageBreak())
             story.append(Paragraph("<b>CERTIFICATE OF SERVICE</b>", title_style))
-            date_str = data.get("date", datetime.now().strftime("%B %d, %Y"))
+            date_str = data["date"]
             cert_text = f"I hereby certify that on {date_str}, a copy of the foregoing document was served via the Court's CM/ECF system on all counsel of record."
             story.append(Paragraph(cert_text, body_style))
             story.append(Spacer(1, 36))
             attorney = data.get("attorney", {})
-            sig = f"/s/ {attorney.get('name', 'Attorney Name')}<br/>{attorney.get('name', 'Attorney Name')}"
+            attorney_name = attorney.get('name', 'Attorney Name')
+            sig = f"/s/ {attorney_name}<br/>{attorney_name}"
             story.append(Paragraph(sig, sig_style))
 
         # Build PDF
         doc.build(story, onFirstPage=self._add_pdf_page_number, onLaterPages=self._add_pdf_page_number)
 
-        buffer.seek(0)
-        filename = self._generate_filename(data, "pdf")
-
-        return filename, buffer.getvalue()
-
     def _build_pdf_caption(self, data: dict) -> str:
         """Build caption text for PDF."""
         plaintiff = data.get("plaintiff", "PLAINTIFF NAME").upper()
@@ -623,48 +739,28 @@ class DocumentGenerator:
         case_display = case_number if case_number else "[Case No. TBD]"
         judge_name = data.get("judge_name", "")
 
-        lines = [
-            "________________________________________",
-            "                                        )",
-            f"{plaintiff},                           )",
-            "                                        )",
-            "               Plaintiff,               )    Case No. " + case_display,
-            "                                        )",
-            "          v.                            )",
-            "                                        )",
-            f"{defendant},                           )",
-            "                                        )",
-            "               Defendant.               )",
-            "________________________________________)   " + (f"Judge: {judge_name}" if judge_name else ""),
-        ]
-        return "\n".join(lines)
+        return _PDF_CAPTION_TEMPLATE.format(
+            plaintiff=plaintiff,
+            defendant=defendant,
+            case_display=case_display,
+            judge_line=f"Judge: {judge_name}" if judge_name else ""
+        )
 
     def _build_pdf_signature(self, data: dict) -> str:
         """Build signature block text for PDF."""
         attorney = data.get("attorney", {})
-        date_str = data.get("date", datetime.now().strftime("%B %d, %Y"))
+        attorney_name = attorney.get('name', 'Attorney Name')
+        date_str = data["date"]
 
         lines = [
             f"Dated: {date_str}",
             "",
             "Respectfully submitted,",
             "",
-            f"/s/ {attorney.get('name', 'Attorney Name')}",
-            attorney.get('name', 'Attorney Name'),
+            f"/s/ {attorney_name}",
+            attorney_name,
         ]
-
-        if attorney.get('firm'):
-            lines.append(attorney['firm'])
-        if attorney.get('address'):
-            lines.append(attorney['address'])
-        if attorney.get('city_state_zip'):
-            lines.append(attorney['city_state_zip'])
-        if attorney.get('phone'):
-            lines.append(f"Tel: {attorney['phone']}")
-        if attorney.get('email'):
-            lines.append(f"Email: {attorney['email']}")
-        if attorney.get('dc_bar_number'):
-            lines.append(f"DC Bar No. {attorney['dc_bar_number']}")
+        lines.extend(_attorney_contact_lines(attorney))
 
         party_represented = data.get("party_represented", "Plaintiff")
         lines.append("")
@@ -674,6 +770,9 @@ class DocumentGenerator:
 
     def _add_pdf_page_number(self, canvas, doc):
         """Add page numbers to PDF."""
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+
         canvas.saveState()
         canvas.setFont('Times-Roman', 12)
         page_num = canvas.getPageNumber()
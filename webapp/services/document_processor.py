@@ -5,21 +5,148 @@ Extracts content from uploaded DOCX files and reformats them
 to DC Federal District Court standards.
 """
 import re
+import posixpath
+import zipfile
 from io import BytesIO
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, BinaryIO, Union
 
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
+from docx.styles import BabelFish
+from lxml import etree
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import FORMAT_SPECS, DC_COURT_NAME, DOCUMENT_TYPES
 
+# Formatting values used on every run, resolved once
+_FONT_NAME = FORMAT_SPECS["font_name"]
+_FONT_SIZE_PT = Pt(FORMAT_SPECS["font_size"])
+_MARGIN = Inches(FORMAT_SPECS["margin_inches"])
+
+
+def _apply_font(run):
+    """Set the document font and size on a run or style."""
+    font = run.font
+    font.name = _FONT_NAME
+    font.size = _FONT_SIZE_PT
+
+
+# Upload extraction reads word/document.xml directly (see _iter_body_paragraphs)
+_MAIN_DOCUMENT = "word/document.xml"
+_MAIN_DOCUMENT_RELS = "word/_rels/document.xml.rels"
+_STYLES_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
+_RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_W_BODY, _W_P, _W_R, _W_HYPERLINK = qn("w:body"), qn("w:p"), qn("w:r"), qn("w:hyperlink")
+_W_PPR, _W_PSTYLE, _W_RPR, _W_B = qn("w:pPr"), qn("w:pStyle"), qn("w:rPr"), qn("w:b")
+_W_STYLE, _W_NAME = qn("w:style"), qn("w:name")
+_W_VAL, _W_TYPE, _W_DEFAULT, _W_STYLE_ID = qn("w:val"), qn("w:type"), qn("w:default"), qn("w:styleId")
+_W_T, _W_BR = qn("w:t"), qn("w:br")
+# Run children with fixed text, as python-docx reads them
+_RUN_CHAR_TEXT = {qn("w:tab"): "\t", qn("w:ptab"): "\t", qn("w:cr"): "\n", qn("w:noBreakHyphen"): "-"}
+_XML_TRUE = ("1", "true", "on")
+
+
+def _run_text(r) -> str:
+    """Text of a <w:r>, matching python-docx's Run.text."""
+    parts = []
+    for child in r:
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or "")
+        elif tag == _W_BR:
+            # Only line breaks are text; page and column breaks are not
+            if child.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_CHAR_TEXT:
+            parts.append(_RUN_CHAR_TEXT[tag])
+    return "".join(parts)
+
+
+def _run_is_bold(r) -> bool:
+    """Whether a <w:r> is directly formatted bold (python-docx's Run.bold)."""
+    rPr = r.find(_W_RPR)
+    b = rPr.find(_W_B) if rPr is not None else None
+    return b is not None and b.get(_W_VAL, "true") in _XML_TRUE
+
+
+def _paragraph_style_names(zf: zipfile.ZipFile) -> tuple:
+    """
+    Paragraph style names by style id, and the default paragraph style's name.
+
+    Resolved the way python-docx resolves Paragraph.style: an unknown id, or
+    one that is not a paragraph style, falls back to the default style.
+    """
+    names, default_name = {}, "Normal"
+    try:
+        rels = etree.fromstring(zf.read(_MAIN_DOCUMENT_RELS))
+        target = next(rel.get("Target") for rel in rels.iter(_RELATIONSHIP)
+                      if rel.get("Type") == _STYLES_REL_TYPE and rel.get("TargetMode") != "External")
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        else:
+            path = posixpath.normpath(posixpath.join(posixpath.dirname(_MAIN_DOCUMENT), target))
+        styles = etree.fromstring(zf.read(path), etree.XMLParser(resolve_entities=False))
+    except (KeyError, StopIteration):
+        # No styles part; python-docx falls back to its default one, whose
+        # default paragraph style is Normal
+        return names, default_name
+
+    for style in styles.iterchildren(_W_STYLE):
+        if style.get(_W_TYPE) != "paragraph":
+            continue
+        name = style.find(_W_NAME)
+        name = BabelFish.internal2ui(name.get(_W_VAL)) if name is not None else None
+        names[style.get(_W_STYLE_ID)] = name
+        if style.get(_W_DEFAULT) in _XML_TRUE:
+            # The last default in document order wins
+            default_name = name
+    return names, default_name
+
+
+def _iter_body_paragraphs(file):
+    """
+    Yield (text, style name, direct runs) for each top-level body paragraph.
+
+    Streams word/document.xml with iterparse instead of loading the whole
+    python-docx object model; paragraphs are freed as soon as they have been
+    read. Like Document.paragraphs, paragraphs inside tables and content
+    controls are skipped, and hyperlink text is included in the text.
+    """
+    with zipfile.ZipFile(file) as zf:
+        style_names, default_style = _paragraph_style_names(zf)
+        with zf.open(_MAIN_DOCUMENT) as f:
+            for _, p in etree.iterparse(f, events=("end",), tag=_W_P, resolve_entities=False):
+                body = p.getparent()
+                if body.tag != _W_BODY:
+                    continue
+
+                runs = []
+                texts = []
+                for child in p:
+                    if child.tag == _W_R:
+                        runs.append(child)
+                        texts.append(_run_text(child))
+                    elif child.tag == _W_HYPERLINK:
+                        texts.extend(_run_text(r) for r in child.iterchildren(_W_R))
+
+                pPr = p.find(_W_PPR)
+                pStyle = pPr.find(_W_PSTYLE) if pPr is not None else None
+                style_id = pStyle.get(_W_VAL) if pStyle is not None else None
+                style_name = style_names.get(style_id, default_style) if style_id is not None else default_style
+
+                yield "".join(texts), style_name or "Normal", runs
+
+                # Drop the paragraph and everything before it in the body
+                p.clear()
+                while p.getprevious() is not None:
+                    del body[0]
+
 
 # Keywords for auto-detecting sections
 SECTION_KEYWORDS = {
@@ -45,33 +172,103 @@ SECTION_KEYWORDS = {
     ]
 }
 
+# One alternation per section, in SECTION_KEYWORDS order; the first section
+# with a keyword in a (lowercased) heading wins
+_SECTION_PATTERNS = tuple(
+    (name, re.compile("|".join(map(re.escape, keywords))))
+    for name, keywords in SECTION_KEYWORDS.items()
+)
+
+# Case number formats, most specific first
+_CASE_NUMBER_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Case\s*(?:No\.?|Number)[:\s]*(\d+[:\-]\d+\-cv\-\d+(?:\-[A-Z]+)?)',
+    r'(\d+[:\-]\d+\-cv\-\d+(?:\-[A-Z]+)?)',
+    r'Civil\s*(?:Action|Case)\s*(?:No\.?)?[:\s]*(\d+[\-:]\d+)',
+))
+
+# Parties from a "v." caption. Names and the gap between the party labels
+# are bounded: unbounded, a caption-less opening that mentions the plaintiff
+# but never the defendant took tens of seconds to fail to match
+_PARTIES_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r'([A-Z][A-Za-z\s,.]{0,99}?)\s*,?\s*(?:Plaintiff|Petitioner).{0,300}?v\.?\s*([A-Z][A-Za-z\s,.]{0,99}?)\s*,?\s*(?:Defendant|Respondent)',
+    r'([A-Z][A-Z\s,.]{0,99})\s+v\.?\s+([A-Z][A-Z\s,.]{0,99})',
+))
+
+# Caption fields are looked for in the first paragraphs, up to this many characters
+_CAPTION_SEARCH_PARAGRAPHS = 20
+_CAPTION_SEARCH_CHARS = 2048
+
+# Assigned judge
+_JUDGE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:Judge|Hon\.?|Honorable)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
+    r'before\s+(?:the\s+)?(?:Hon\.?|Honorable)\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
+))
+
+# Text that only appears in a caption block (matched case-sensitively)
+_CAPTION_RE = re.compile("|".join(map(re.escape, (
+    "UNITED STATES DISTRICT COURT",
+    "DISTRICT OF COLUMBIA",
+    "Plaintiff,",
+    "Defendant,",
+    "Case No.",
+    "Civil Action",
+    "_____",
+))))
+
+# Optional attorney fields in signature-block order, with their line format
+_ATTORNEY_FIELDS = (
+    ("firm", "{}"),
+    ("address", "{}"),
+    ("city_state_zip", "{}"),
+    ("phone", "Tel: {}"),
+    ("email", "Email: {}"),
+    ("dc_bar_number", "DC Bar No. {}"),
+)
+
+# Caption cell text; only the party names, case number and judge vary
+_PARTIES_TEMPLATE = """\
+________________________________________
+                                        )
+{plaintiff},
+                                        )
+               Plaintiff,               )
+                                        )
+          v.                            )
+                                        )
+{defendant},
+                                        )
+               Defendant.               )
+________________________________________)"""
+
+_CASE_INFO_TEMPLATE = "\n\n\n\nCase No. {case_display}\n\n\n"
+
 
 class DocumentProcessor:
     """Processes uploaded documents and reformats them to DC court standards."""
 
-    def extract_from_docx(self, file_bytes: bytes) -> Dict[str, Any]:
+    def extract_from_docx(self, file: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         """
         Extract text and structure from a DOCX file.
 
         Args:
-            file_bytes: Raw bytes of the DOCX file
+            file: Raw bytes of the DOCX file, or a seekable binary file
+                (read in place, without copying it into memory)
 
         Returns:
             Dictionary containing extracted content and metadata
         """
-        doc = Document(BytesIO(file_bytes))
-
         paragraphs = []
-        for para in doc.paragraphs:
-            text = para.text.strip()
+        word_count = 0
+        source = BytesIO(file) if isinstance(file, (bytes, bytearray)) else file
+        for text, style_name, runs in _iter_body_paragraphs(source):
+            text = text.strip()
             if text:
-                # Detect if paragraph is a heading
-                is_heading = self._is_heading(para)
                 paragraphs.append({
                     "text": text,
-                    "is_heading": is_heading,
-                    "style": para.style.name if para.style else "Normal"
+                    "is_heading": self._is_heading(text, style_name, runs),
+                    "style": style_name
                 })
+                word_count += len(text.split())
 
         # Try to extract case information from caption
         case_info = self._extract_case_info(paragraphs)
@@ -84,32 +281,37 @@ class DocumentProcessor:
             "full_text": "\n\n".join([p["text"] for p in paragraphs]),
             "case_info": case_info,
             "sections": sections,
-            "word_count": sum(len(p["text"].split()) for p in paragraphs),
+            "word_count": word_count,
             "paragraph_count": len(paragraphs)
         }
 
-    def _is_heading(self, para) -> bool:
-        """Determine if a paragraph is a heading."""
+    def _is_heading(self, text: str, style_name: str, runs: list) -> bool:
+        """Determine if a paragraph is a heading, given its stripped text, style name and <w:r> elements."""
         # Check style name
-        if para.style and "heading" in para.style.name.lower():
+        if "heading" in style_name.lower():
             return True
 
-        # Check if all caps and short
-        text = para.text.strip()
-        if text.isupper() and len(text) < 100:
-            return True
+        # Otherwise only short paragraphs qualify
+        if len(text) >= 100:
+            return False
 
-        # Check if bold throughout
-        if para.runs:
-            all_bold = all(run.bold for run in para.runs if run.text.strip())
-            if all_bold and len(text) < 100:
-                return True
+        # Check if all caps
+        if text.isupper():
+            return True
 
-        return False
+        # Check if bold throughout, stopping at the first non-bold run
+        if not runs:
+            return False
+        for r in runs:
+            if not _run_is_bold(r) and _run_text(r).strip():
+                return False
+        return True
 
     def _extract_case_info(self, paragraphs: List[Dict]) -> Dict[str, str]:
         """Extract case information from document text."""
-        full_text = "\n".join([p["text"] for p in paragraphs[:20]])  # Check first 20 paragraphs
+        full_text = "\n".join(
+            p["text"] for p in paragraphs[:_CAPTION_SEARCH_PARAGRAPHS]
+        )[:_CAPTION_SEARCH_CHARS]
 
         case_info = {
             "case_number": "",
@@ -120,39 +322,23 @@ class DocumentProcessor:
         }
 
         # Extract case number (various formats)
-        case_patterns = [
-            r'Case\s*(?:No\.?|Number)[:\s]*(\d+[:\-]\d+\-cv\-\d+(?:\-[A-Z]+)?)',
-            r'(\d+[:\-]\d+\-cv\-\d+(?:\-[A-Z]+)?)',
-            r'Civil\s*(?:Action|Case)\s*(?:No\.?)?[:\s]*(\d+[\-:]\d+)',
-        ]
-
-        for pattern in case_patterns:
-            match = re.search(pattern, full_text, re.IGNORECASE)
+        for pattern in _CASE_NUMBER_PATTERNS:
+            match = pattern.search(full_text)
             if match:
                 case_info["case_number"] = match.group(1)
                 break
 
         # Extract parties from "v." pattern
-        vs_patterns = [
-            r'([A-Z][A-Za-z\s,\.]+?)\s*,?\s*(?:Plaintiff|Petitioner).*?v\.?\s*([A-Z][A-Za-z\s,\.]+?)\s*,?\s*(?:Defendant|Respondent)',
-            r'([A-Z][A-Z\s,\.]+)\s+v\.?\s+([A-Z][A-Z\s,\.]+)',
-        ]
-
-        for pattern in vs_patterns:
-            match = re.search(pattern, full_text, re.IGNORECASE | re.DOTALL)
+        for pattern in _PARTIES_PATTERNS:
+            match = pattern.search(full_text)
             if match:
                 case_info["plaintiff"] = match.group(1).strip()
                 case_info["defendant"] = match.group(2).strip()
                 break
 
         # Extract judge name
-        judge_patterns = [
-            r'(?:Judge|Hon\.?|Honorable)[:\s]+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
-            r'before\s+(?:the\s+)?(?:Hon\.?|Honorable)\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-        ]
-
-        for pattern in judge_patterns:
-            match = re.search(pattern, full_text, re.IGNORECASE)
+        for pattern in _JUDGE_PATTERNS:
+            match = pattern.search(full_text)
             if match:
                 case_info["judge_name"] = match.group(1).strip()
                 break
@@ -191,13 +377,13 @@ class DocumentProcessor:
 
         for para in paragraphs:
             text = para["text"]
-            text_lower = text.lower()
 
             # Check if this paragraph starts a new section
             detected_section = None
             if para["is_heading"]:
-                for section_name, keywords in SECTION_KEYWORDS.items():
-                    if any(kw in text_lower for kw in keywords):
+                text_lower = text.lower()
+                for section_name, pattern in _SECTION_PATTERNS:
+                    if pattern.search(text_lower):
                         detected_section = section_name
                         break
 
@@ -228,16 +414,7 @@ class DocumentProcessor:
 
     def _looks_like_caption(self, text: str) -> bool:
         """Check if text looks like a caption block."""
-        caption_indicators = [
-            "UNITED STATES DISTRICT COURT",
-            "DISTRICT OF COLUMBIA",
-            "Plaintiff,",
-            "Defendant,",
-            "Case No.",
-            "Civil Action",
-            "_____"
-        ]
-        return any(ind in text for ind in caption_indicators)
+        return _CAPTION_RE.search(text) is not None
 
     def reformat_to_dc_standards(
         self,
@@ -286,11 +463,9 @@ class DocumentProcessor:
         # Add page numbers
         self._add_page_numbers(doc)
 
-        # Save to bytes
+        # Save to bytes; getvalue() hands back the buffer without copying it
         buffer = BytesIO()
         doc.save(buffer)
-        buffer.seek(0)
-
         return buffer.getvalue()
 
     def _setup_document_format(self, doc: Document):
@@ -302,16 +477,14 @@ class DocumentProcessor:
         section.page_height = Inches(11)
 
         # Margins: 1 inch all sides
-        section.top_margin = Inches(FORMAT_SPECS["margin_inches"])
-        section.bottom_margin = Inches(FORMAT_SPECS["margin_inches"])
-        section.left_margin = Inches(FORMAT_SPECS["margin_inches"])
-        section.right_margin = Inches(FORMAT_SPECS["margin_inches"])
+        section.top_margin = _MARGIN
+        section.bottom_margin = _MARGIN
+        section.left_margin = _MARGIN
+        section.right_margin = _MARGIN
 
         # Default font: Times New Roman 12pt
         style = doc.styles['Normal']
-        font = style.font
-        font.name = FORMAT_SPECS["font_name"]
-        font.size = Pt(FORMAT_SPECS["font_size"])
+        _apply_font(style)
 
         # Line spacing: Double
         paragraph_format = style.paragraph_format
@@ -324,8 +497,7 @@ class DocumentProcessor:
         court_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         court_run = court_para.add_run(DC_COURT_NAME)
         court_run.bold = True
-        court_run.font.name = FORMAT_SPECS["font_name"]
-        court_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _apply_font(court_run)
 
         doc.add_paragraph()
 
@@ -343,26 +515,10 @@ class DocumentProcessor:
         plaintiff = case_info.get("plaintiff", "PLAINTIFF NAME").upper()
         defendant = case_info.get("defendant", "DEFENDANT NAME").upper()
 
-        parties_lines = [
-            "________________________________________",
-            "                                        )",
-            f"{plaintiff},",
-            "                                        )",
-            "               Plaintiff,               )",
-            "                                        )",
-            "          v.                            )",
-            "                                        )",
-            f"{defendant},",
-            "                                        )",
-            "               Defendant.               )",
-            "________________________________________)",
-        ]
-
         left_para = left_cell.paragraphs[0]
         left_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        left_run = left_para.add_run("\n".join(parties_lines))
-        left_run.font.name = FORMAT_SPECS["font_name"]
-        left_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        left_run = left_para.add_run(_PARTIES_TEMPLATE.format(plaintiff=plaintiff, defendant=defendant))
+        _apply_font(left_run)
         left_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
 
         # Build case info block
@@ -370,36 +526,31 @@ class DocumentProcessor:
         case_display = case_number if case_number else "[Case No. TBD]"
         judge_name = case_info.get("judge_name", "")
 
-        case_lines = ["", "", "", "", f"Case No. {case_display}", "", "", ""]
+        case_text = _CASE_INFO_TEMPLATE.format(case_display=case_display)
         if judge_name:
-            case_lines.append(f"Judge: {judge_name}")
+            case_text += f"\nJudge: {judge_name}"
 
         right_para = right_cell.paragraphs[0]
         right_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        right_run = right_para.add_run("\n".join(case_lines))
-        right_run.font.name = FORMAT_SPECS["font_name"]
-        right_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        right_run = right_para.add_run(case_text)
+        _apply_font(right_run)
         right_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
 
         doc.add_paragraph()
 
     def _add_document_title(self, doc: Document, doc_type: str, custom_title: str = ""):
         """Add the document title."""
-        doc_config = DOCUMENT_TYPES.get(doc_type, DOCUMENT_TYPES.get("motion_to_dismiss"))
-
         if custom_title:
             title = custom_title.upper()
-        elif doc_config:
-            title = doc_config["title"]
         else:
-            title = "MOTION"
+            doc_config = DOCUMENT_TYPES.get(doc_type) or DOCUMENT_TYPES.get("motion_to_dismiss")
+            title = doc_config["title"] if doc_config else "MOTION"
 
         title_para = doc.add_paragraph()
         title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         title_run = title_para.add_run(title)
         title_run.bold = True
-        title_run.font.name = FORMAT_SPECS["font_name"]
-        title_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _apply_font(title_run)
 
         doc.add_paragraph()
 
@@ -413,8 +564,7 @@ class DocumentProcessor:
             intro_para = doc.add_paragraph()
             intro_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
             intro_run = intro_para.add_run(intro_text)
-            intro_run.font.name = FORMAT_SPECS["font_name"]
-            intro_run.font.size = Pt(FORMAT_SPECS["font_size"])
+            _apply_font(intro_run)
             intro_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
 
             doc.add_paragraph()
@@ -446,21 +596,18 @@ class DocumentProcessor:
         heading_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         heading_run = heading_para.add_run(heading)
         heading_run.bold = True
-        heading_run.font.name = FORMAT_SPECS["font_name"]
-        heading_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _apply_font(heading_run)
 
     def _add_content_paragraph(self, doc: Document, content: str):
         """Add a justified, double-spaced content paragraph."""
         # Split by double newlines to preserve paragraph breaks
-        paragraphs = content.split("\n\n")
-
-        for para_text in paragraphs:
-            if para_text.strip():
+        for para_text in content.split("\n\n"):
+            para_text = para_text.strip()
+            if para_text:
                 para = doc.add_paragraph()
                 para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                run = para.add_run(para_text.strip())
-                run.font.name = FORMAT_SPECS["font_name"]
-                run.font.size = Pt(FORMAT_SPECS["font_size"])
+                run = para.add_run(para_text)
+                _apply_font(run)
                 para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
                 para.paragraph_format.first_line_indent = Inches(0.5)
 
@@ -481,35 +628,25 @@ class DocumentProcessor:
         date_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
 
         # Right: Signature block
+        attorney_name = attorney_info.get('name', 'Attorney Name')
         sig_lines = [
             "Respectfully submitted,",
             "",
-            f"/s/ {attorney_info.get('name', 'Attorney Name')}",
-            attorney_info.get('name', 'Attorney Name'),
+            f"/s/ {attorney_name}",
+            attorney_name,
         ]
-
-        if attorney_info.get('firm'):
-            sig_lines.append(attorney_info['firm'])
-        if attorney_info.get('address'):
-            sig_lines.append(attorney_info['address'])
-        if attorney_info.get('city_state_zip'):
-            sig_lines.append(attorney_info['city_state_zip'])
-        if attorney_info.get('phone'):
-            sig_lines.append(f"Tel: {attorney_info['phone']}")
-        if attorney_info.get('email'):
-            sig_lines.append(f"Email: {attorney_info['email']}")
-        if attorney_info.get('dc_bar_number'):
-            sig_lines.append(f"DC Bar No. {attorney_info['dc_bar_number']}")
+        sig_lines.extend(
+            fmt.format(value) for key, fmt in _ATTORNEY_FIELDS if (value := attorney_info.get(key))
+        )
 
         party_represented = case_info.get("party_represented", "Plaintiff")
         sig_lines.extend(["", f"Counsel for {party_represented}"])
 
+        # One run for the whole block; python-docx turns each "\n" into a
+        # line break, so this renders the same as a run per line
         sig_para = right_cell.paragraphs[0]
         sig_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        for line in sig_lines:
-            run = sig_para.add_run(line + "\n")
-            run.font.name = FORMAT_SPECS["font_name"]
-            run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _apply_font(sig_para.add_run("\n".join(sig_lines) + "\n"))
         sig_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
 
     def _add_certificate_of_service(self, doc: Document, attorney_info: Dict[str, str], case_info: Dict[str, str]):
@@ -521,8 +658,7 @@ class DocumentProcessor:
         title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         title_run = title_para.add_run("CERTIFICATE OF SERVICE")
         title_run.bold = True
-        title_run.font.name = FORMAT_SPECS["font_name"]
-        title_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _apply_font(title_run)
 
         doc.add_paragraph()
 
@@ -533,8 +669,7 @@ class DocumentProcessor:
         cert_para = doc.add_paragraph()
         cert_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
         cert_run = cert_para.add_run(cert_text)
-        cert_run.font.name = FORMAT_SPECS["font_name"]
-        cert_run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _apply_font(cert_run)
         cert_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.DOUBLE
         cert_para.paragraph_format.first_line_indent = Inches(0.5)
 
@@ -544,14 +679,8 @@ class DocumentProcessor:
         # Signature
         sig_para = doc.add_paragraph()
         sig_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        sig_lines = [
-            f"/s/ {attorney_info.get('name', 'Attorney Name')}",
-            attorney_info.get('name', 'Attorney Name'),
-        ]
-        for line in sig_lines:
-            run = sig_para.add_run(line + "\n")
-            run.font.name = FORMAT_SPECS["font_name"]
-            run.font.size = Pt(FORMAT_SPECS["font_size"])
+        attorney_name = attorney_info.get('name', 'Attorney Name')
+        _apply_font(sig_para.add_run(f"/s/ {attorney_name}\n{attorney_name}\n"))
 
     def _add_page_numbers(self, doc: Document):
         """Add page numbers to the footer (bottom center)."""
@@ -576,8 +705,7 @@ class DocumentProcessor:
         run._r.append(instrText)
         run._r.append(fldChar2)
 
-        run.font.name = FORMAT_SPECS["font_name"]
-        run.font.size = Pt(FORMAT_SPECS["font_size"])
+        _apply_font(run)
 
 
 # Convenience function
@@ -3,17 +3,55 @@ Perplexity AI Client for Court Research Fallback
 
 Used when CourtListener API times out or is unavailable.
 """
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
 from config import Config
 
 
+# Kept-alive connections to the Perplexity API, shared by every client in
+# the process so a search after the first skips the TCP and TLS handshake
+POOL_MAXSIZE = 4
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE))
+
+# What each search type asks the model to look for
+_TYPE_CONTEXT = {
+    "o": "court opinions and case law",
+    "d": "court dockets and case filings",
+    "r": "PACER/RECAP court documents"
+}
+
+_SYSTEM_PROMPT = """You are a legal research assistant specializing in U.S. federal court cases,
+particularly the U.S. District Court for the District of Columbia.
+Provide accurate, well-sourced information about court cases.
+Always include case names, docket numbers, judges, and filing dates when available.
+Format your response with clear sections for each case found."""
+
+_USER_PROMPT_TEMPLATE = """Search for {type_context} related to: {query}
+
+Focus on DC District Court (U.S. District Court for the District of Columbia) cases when possible.
+For each relevant case found, provide:
+- Case name (e.g., Smith v. Jones)
+- Docket number if available
+- Judge name
+- Filing date or decision date
+- Brief summary of what the case is about
+
+Search sources like CourtListener, Justia, and official court records."""
+
+
 class PerplexityClient:
     """Client for Perplexity AI search API."""
 
     def __init__(self):
         self.api_key = Config.PERPLEXITY_API_KEY
         self.base_url = "https://api.perplexity.ai/chat/completions"
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
 
     def is_configured(self) -> bool:
         """Check if Perplexity API is configured."""
@@ -34,47 +72,23 @@ class PerplexityClient:
             return {"error": "Perplexity API not configured"}
 
         # Build a focused legal search prompt
-        type_context = {
-            "o": "court opinions and case law",
-            "d": "court dockets and case filings",
-            "r": "PACER/RECAP court documents"
-        }.get(search_type, "court cases")
-
-        system_prompt = """You are a legal research assistant specializing in U.S. federal court cases,
-particularly the U.S. District Court for the District of Columbia.
-Provide accurate, well-sourced information about court cases.
-Always include case names, docket numbers, judges, and filing dates when available.
-Format your response with clear sections for each case found."""
-
-        user_prompt = f"""Search for {type_context} related to: {query}
-
-Focus on DC District Court (U.S. District Court for the District of Columbia) cases when possible.
-For each relevant case found, provide:
-- Case name (e.g., Smith v. Jones)
-- Docket number if available
-- Judge name
-- Filing date or decision date
-- Brief summary of what the case is about
-
-Search sources like CourtListener, Justia, and official court records."""
+        type_context = _TYPE_CONTEXT.get(search_type, "court cases")
+        user_prompt = _USER_PROMPT_TEMPLATE.format(type_context=type_context, query=query)
 
         try:
-            response = requests.post(
+            response = _session.post(
                 self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
+                headers=self.headers,
+                data=orjson.dumps({
                     "model": "sonar",
                     "messages": [
-                        {"role": "system", "content": system_prompt},
+                        {"role": "system", "content": _SYSTEM_PROMPT},
                         {"role": "user", "content": user_prompt}
                     ],
                     "max_tokens": 1500,
                     "temperature": 0.1,
                     "return_citations": True
-                },
+                }),
                 timeout=30
             )
 
@@ -84,7 +98,7 @@ Search sources like CourtListener, Justia, and official court records."""
             if not response.ok:
                 return {"error": f"Perplexity API error: {response.status_code}"}
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Extract the response content and citations
             content = ""
@@ -108,5 +122,7 @@ Search sources like CourtListener, Justia, and official court records."""
             return {"error": "Perplexity search timed out. Please try again."}
         except requests.exceptions.RequestException as e:
             return {"error": f"Network error: {str(e)}"}
+        except orjson.JSONDecodeError as e:
+            return {"error": f"Invalid JSON response from Perplexity API: {str(e)}"}
         except Exception as e:
             return {"error": f"Unexpected error: {str(e)}"}
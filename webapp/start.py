@@ -2,18 +2,26 @@
 DC Federal Court Document Drafter - Launcher
 Double-click this file to start the application.
 """
+import socket
 import webbrowser
 import threading
 import time
 import sys
 import os
+import importlib.util
 
 # Set up path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def open_browser():
-    """Open browser after a short delay to let server start."""
-    time.sleep(1.5)
+def open_browser(timeout=10.0):
+    """Open the browser as soon as the server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', 5000), timeout=0.05).close()
+            break
+        except OSError:
+            time.sleep(0.02)
     webbrowser.open('http://localhost:5000')
 
 if __name__ == '__main__':
@@ -28,6 +36,12 @@ if __name__ == '__main__':
     # Open browser in background thread
     threading.Thread(target=open_browser, daemon=True).start()
 
-    # Start Flask (disable reloader to avoid double browser open)
+    # Start the server (no reloader, to avoid a double browser open).
+    # waitress serves requests from a thread pool and runs on Windows,
+    # where gunicorn does not
     app = create_app()
-    app.run(host='127.0.0.1', port=5000, debug=False)
+    if importlib.util.find_spec('waitress'):
+        from waitress import serve
+        serve(app, host='127.0.0.1', port=5000, threads=8)
+    else:
+        app.run(host='127.0.0.1', port=5000, debug=False, threaded=True)